@@ -0,0 +1,112 @@
+# log_follow.py
+
+import json
+import os
+import time
+
+# 새 줄이 없을 때 폴링 간격 (0.1초에서 시작해 최대 2초까지 두 배씩 늘림)
+MIN_POLL_INTERVAL = 0.1
+MAX_POLL_INTERVAL = 2.0
+
+# 한 번에 읽어 들일 최대 크기 (1MB)
+READ_SIZE = 1024 * 1024
+
+
+# 로그 파일 옆에 두는 상태 파일 경로 (마지막으로 처리한 위치 저장)
+def state_path_for(log_path):
+    return log_path + '.state'
+
+
+# 상태 파일에서 inode와 바이트 위치를 읽음 (없거나 깨졌으면 처음부터)
+def load_state(state_path):
+    try:
+        with open(state_path, 'r', encoding='utf-8') as file:
+            state = json.load(file)
+        return int(state['inode']), int(state['offset'])
+    except (FileNotFoundError, ValueError, KeyError, TypeError):
+        return None, 0
+
+
+# 임시 파일에 쓴 뒤 교체하여 중간에 종료되어도 상태 파일이 깨지지 않게 저장
+def save_state(state_path, inode, offset):
+    tmp_path = state_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as file:
+        json.dump({'inode': inode, 'offset': offset}, file)
+    os.replace(tmp_path, state_path)
+
+
+# 로그 파일을 열고 이전에 처리한 위치로 이동
+# 같은 파일(inode)이고 잘리지 않았을 때만 이어서 읽고, 아니면 처음부터 읽는다.
+def open_at_saved_offset(log_path, saved_inode, saved_offset):
+    file = open(log_path, 'rb')
+    stat = os.fstat(file.fileno())
+    if stat.st_ino == saved_inode and saved_offset <= stat.st_size:
+        file.seek(saved_offset)
+    return file
+
+
+# 열린 파일에서 새로 추가된 완전한 줄만 읽어 반환 (줄바꿈 문자는 제외)
+# 아직 줄바꿈이 기록되지 않은 마지막 조각은 다음 호출 때 다시 읽는다.
+# 각 줄의 바이트 길이 + 1(줄바꿈)을 더해 가면 그 줄이 끝나는 위치를 알 수 있다.
+def read_new_lines(file, read_size=READ_SIZE):
+    start = file.tell()
+    data = b''
+    while True:
+        chunk = file.read(read_size)
+        data += chunk
+        if len(chunk) < read_size or b'\n' in chunk:
+            break
+    end = data.rfind(b'\n') + 1
+    file.seek(start + end)
+    return data[:end].split(b'\n')[:-1]
+
+
+# 로그 파일에 새로 추가되는 줄만 계속 반환 (tail -F 와 비슷하게 동작)
+# 로그 교체(rotation)는 inode 변경으로, 잘림(truncation)은 파일 크기 감소로 감지한다.
+# 위치는 마지막으로 넘겨준 줄이 끝나는 곳까지만 저장하므로, 읽어 둔 줄을 다 넘겨주기 전에
+# 중단(Ctrl + C, 제너레이터 close)되어도 다음 실행 때 넘겨준 줄을 다시 출력하거나 빠뜨리지 않는다.
+def follow(log_path, state_path=None):
+    state_path = state_path or state_path_for(log_path)
+    saved_inode, saved_offset = load_state(state_path)
+    file = open_at_saved_offset(log_path, saved_inode, saved_offset)
+    inode = os.fstat(file.fileno()).st_ino
+    offset = file.tell()  # 마지막으로 넘겨준 줄이 끝나는 위치
+    interval = MIN_POLL_INTERVAL
+
+    try:
+        while True:
+            lines = read_new_lines(file)
+            if lines:
+                for line in lines:
+                    offset += len(line) + 1
+                    yield line.rstrip(b'\r').decode('utf-8')
+                save_state(state_path, inode, offset)
+                interval = MIN_POLL_INTERVAL
+                continue
+
+            try:
+                stat = os.stat(log_path)
+            except FileNotFoundError:
+                stat = None
+
+            if stat is not None and stat.st_ino != inode:
+                # 교체된 이전 파일은 위에서 끝까지 읽었으므로 새 파일을 처음부터 읽음
+                file.close()
+                file = open(log_path, 'rb')
+                inode = os.fstat(file.fileno()).st_ino
+                offset = 0
+                save_state(state_path, inode, 0)
+                continue
+
+            if stat is not None and stat.st_size < file.tell():
+                # 파일이 잘렸으면 처음부터 다시 읽음
+                file.seek(0)
+                offset = 0
+                save_state(state_path, inode, 0)
+                continue
+
+            time.sleep(interval)
+            interval = min(interval * 2, MAX_POLL_INTERVAL)
+    finally:
+        file.close()
+        save_state(state_path, inode, offset)
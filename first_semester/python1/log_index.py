@@ -0,0 +1,146 @@
+# log_index.py
+
+import os
+import struct
+from bisect import bisect_left
+
+# 인덱스에 기록할 간격 (N줄마다 한 번씩 '시간 → 바이트 위치' 저장)
+INDEX_STEP = 1024
+
+# 인덱스 파일 구조
+# 헤더: 매직 문자열, 로그 파일 inode, 인덱싱한 끝 위치(마지막 완전한 줄의 끝), 인덱싱한 줄 수, 항목 수
+# 항목: 'YYYY-MM-DD HH:MM:SS' 19바이트 시간 문자열 + 8바이트 오프셋
+INDEX_MAGIC = b'MLOGIDX2'
+HEADER = struct.Struct('<8sqqqq')
+ENTRY = struct.Struct('<19sq')
+TIMESTAMP_LEN = 19
+
+
+# 로그 한 줄을 표현하는 레코드 (__slots__로 줄마다 dict를 만들지 않음)
+class LogRecord:
+    __slots__ = ('timestamp', 'event', 'message')
+
+    def __init__(self, timestamp, event, message):
+        self.timestamp = timestamp
+        self.event = event
+        self.message = message
+
+    def __repr__(self):
+        return f'LogRecord({self.timestamp!r}, {self.event!r}, {self.message!r})'
+
+    def __str__(self):
+        return f'{self.timestamp},{self.event},{self.message}'
+
+
+# 'timestamp,event,message' 한 줄을 LogRecord로 변환 (형식이 다르면 None)
+def parse_line(line):
+    parts = line.rstrip('\r\n').split(',', 2)
+    if len(parts) != 3 or parts[0] == 'timestamp':
+        return None
+    return LogRecord(parts[0], parts[1], parts[2])
+
+
+# 로그 파일 옆에 두는 인덱스 파일 경로
+def index_path_for(log_path):
+    return log_path + '.idx'
+
+
+# 로그 파일의 offset 위치부터 끝까지 읽으며 step 줄마다 (시간, 바이트 위치)를 entries에 추가
+# count는 지금까지 인덱싱한 줄 수이며, (마지막 완전한 줄의 끝 위치, 인덱싱한 줄 수)를 반환한다.
+# 아직 줄바꿈이 기록되지 않은 마지막 줄은 다음에 이어서 인덱싱할 때 처리한다.
+def _scan_lines(file, offset, count, entries, step):
+    file.seek(offset)
+    for line in file:
+        if not line.endswith(b'\n'):
+            break
+        # 헤더나 형식이 맞지 않는 줄은 건너뜀
+        if line[4:5] == b'-' and len(line) > TIMESTAMP_LEN:
+            if count % step == 0:
+                entries.append((line[:TIMESTAMP_LEN], offset))
+            count += 1
+        offset += len(line)
+    return offset, count
+
+
+def _save_index(index_path, inode, end, count, entries):
+    with open(index_path, 'wb') as file:
+        file.write(HEADER.pack(INDEX_MAGIC, inode, end, count, len(entries)))
+        for timestamp, entry_offset in entries:
+            file.write(ENTRY.pack(timestamp, entry_offset))
+
+
+# 로그 파일을 한 번 훑으며 INDEX_STEP 줄마다 시간과 바이트 위치를 인덱스 파일로 저장
+def build_index(log_path, index_path=None, step=INDEX_STEP):
+    index_path = index_path or index_path_for(log_path)
+    entries = []
+
+    with open(log_path, 'rb') as file:
+        inode = os.fstat(file.fileno()).st_ino
+        end, count = _scan_lines(file, 0, 0, entries, step)
+
+    _save_index(index_path, inode, end, count, entries)
+    return entries
+
+
+# 인덱스 파일을 읽어 (시간 목록, 오프셋 목록)으로 반환
+# 인덱스가 없거나 로그 파일이 교체/잘렸으면 새로 만들고,
+# 로그 파일 뒤에 줄이 추가되기만 했으면 인덱싱한 끝 위치부터 추가된 부분만 읽어 인덱스를 늘린다.
+def load_index(log_path, index_path=None, step=INDEX_STEP):
+    index_path = index_path or index_path_for(log_path)
+    stat = os.stat(log_path)
+
+    try:
+        with open(index_path, 'rb') as file:
+            data = file.read()
+        magic, inode, end, count, entry_count = HEADER.unpack_from(data, 0)
+        if magic != INDEX_MAGIC or inode != stat.st_ino or end > stat.st_size:
+            raise ValueError('오래된 인덱스')
+        entries = list(ENTRY.iter_unpack(data[HEADER.size:HEADER.size + entry_count * ENTRY.size]))
+
+        with open(log_path, 'rb') as file:
+            # 마지막 항목의 시간이 그대로인지 확인 (같은 파일을 다시 쓴 경우면 새로 만듦)
+            if entries:
+                timestamp, entry_offset = entries[-1]
+                file.seek(entry_offset)
+                if file.read(TIMESTAMP_LEN) != timestamp:
+                    raise ValueError('오래된 인덱스')
+            new_end, count = _scan_lines(file, end, count, entries, step)
+        if new_end != end:
+            _save_index(index_path, inode, new_end, count, entries)
+    except (FileNotFoundError, ValueError, struct.error):
+        entries = build_index(log_path, index_path, step)
+
+    timestamps = [timestamp.decode('ascii') for timestamp, _ in entries]
+    offsets = [entry_offset for _, entry_offset in entries]
+    return timestamps, offsets
+
+
+# start ~ end 범위의 레코드 반환 (로그는 시간순으로 기록되어 있다고 가정)
+# end는 앞부분 일치로 비교하므로 '2023-08-27 10:30'은 10:30:59까지 포함한다.
+def query_range(log_path, start, end, index_path=None):
+    timestamps, offsets = load_index(log_path, index_path)
+
+    # 이진 탐색으로 start보다 앞선 마지막 인덱스 지점부터 읽기 시작
+    position = bisect_left(timestamps, start) - 1
+    offset = offsets[position] if position >= 0 else 0
+
+    with open(log_path, 'rb') as file:
+        file.seek(offset)
+        for line in file:
+            record = parse_line(line.decode('utf-8'))
+            if record is None:
+                continue
+            if record.timestamp < start:
+                continue
+            if record.timestamp[:len(end)] > end:
+                break
+            yield record
+
+
+# 인덱스 없이 파일 전체를 읽으며 범위에 해당하는 레코드 반환 (비교용)
+def scan_range(log_path, start, end):
+    with open(log_path, 'r', encoding='utf-8') as file:
+        for line in file:
+            record = parse_line(line)
+            if record is not None and start <= record.timestamp and record.timestamp[:len(end)] <= end:
+                yield record
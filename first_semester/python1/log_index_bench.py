@@ -0,0 +1,65 @@
+# log_index_bench.py
+# 합성 로그(기본 1천만 줄)로 전체 스캔과 인덱스 범위 조회 속도를 비교한다.
+# 사용법: python log_index_bench.py [줄 수]
+
+import calendar
+import os
+import sys
+import tempfile
+import time
+
+from log_index import build_index, query_range, scan_range
+
+EVENTS = ['INFO', 'INFO', 'INFO', 'WARNING', 'ERROR']
+
+
+# 1초 간격으로 시간이 증가하는 합성 로그 파일 생성 (UTC 기준이라 서머타임 영향 없음)
+def make_synthetic_log(path, line_count):
+    start = calendar.timegm((2023, 8, 27, 0, 0, 0))
+    with open(path, 'w', encoding='utf-8', buffering=1024 * 1024) as file:
+        file.write('timestamp,event,message\n')
+        for i in range(line_count):
+            timestamp = time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(start + i))
+            file.write(f'{timestamp},{EVENTS[i % len(EVENTS)]},Synthetic event number {i}.\n')
+
+
+# 함수 실행 시간(초)과 결과 반환
+def measure(func, *args):
+    begin = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - begin, result
+
+
+def main():
+    line_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        log_path = os.path.join(tmp_dir, 'synthetic_mission.log')
+
+        print(f'합성 로그 {line_count:,}줄 생성 중...')
+        elapsed, _ = measure(make_synthetic_log, log_path, line_count)
+        print(f'  생성: {elapsed:.2f}초, 크기 {os.path.getsize(log_path) / 1024 / 1024:.1f}MB')
+
+        elapsed, entries = measure(build_index, log_path)
+        print(f'  인덱스 생성: {elapsed:.2f}초, 항목 {len(entries):,}개')
+
+        # 로그 중간 지점의 25분 구간 조회
+        middle = calendar.timegm((2023, 8, 27, 0, 0, 0)) + line_count // 2
+        start = time.strftime('%Y-%m-%d %H:%M', time.gmtime(middle))
+        end = time.strftime('%Y-%m-%d %H:%M', time.gmtime(middle + 25 * 60))
+        print(f'\n[ {start} ~ {end} 구간 조회 ]')
+
+        scan_time, scanned = measure(lambda: list(scan_range(log_path, start, end)))
+        query_time, queried = measure(lambda: list(query_range(log_path, start, end)))
+
+        if len(scanned) != len(queried):
+            print('오류: 전체 스캔과 인덱스 조회 결과가 다릅니다.')
+            return
+
+        print(f'  전체 스캔: {scan_time:.4f}초 ({len(scanned):,}건)')
+        print(f'  인덱스 조회: {query_time:.4f}초 ({len(queried):,}건)')
+        print(f'  속도 향상: {scan_time / query_time:.1f}배')
+
+
+if __name__ == '__main__':
+    main()
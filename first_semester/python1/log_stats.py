@@ -0,0 +1,129 @@
+# log_stats.py
+
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# 요약표에 항상 표시할 이벤트 종류
+EVENT_LEVELS = ['INFO', 'WARNING', 'ERROR']
+
+
+# 로그 파일 묶음에서 집계한 부분 결과
+# counts: 이벤트별 건수, histogram: 'YYYY-MM-DD HH:MM' 분 단위 건수
+class LogStats:
+    __slots__ = ('files', 'lines', 'counts', 'first', 'last', 'histogram')
+
+    def __init__(self):
+        self.files = 0
+        self.lines = 0
+        self.counts = {}
+        self.first = None
+        self.last = None
+        self.histogram = {}
+
+    # 다른 부분 결과를 현재 결과에 합침
+    def merge(self, other):
+        self.files += other.files
+        self.lines += other.lines
+        for event, count in other.counts.items():
+            self.counts[event] = self.counts.get(event, 0) + count
+        for minute, count in other.histogram.items():
+            self.histogram[minute] = self.histogram.get(minute, 0) + count
+        if other.first is not None and (self.first is None or other.first < self.first):
+            self.first = other.first
+        if other.last is not None and (self.last is None or other.last > self.last):
+            self.last = other.last
+        return self
+
+
+# 로그 파일 하나를 읽어 통계를 누적 (한 줄씩 읽으므로 파일 크기와 무관하게 메모리 일정)
+def collect_file(path, stats):
+    counts = stats.counts
+    histogram = stats.histogram
+    first = stats.first
+    last = stats.last
+    lines = 0
+
+    with open(path, 'r', encoding='utf-8') as file:
+        for line in file:
+            parts = line.split(',', 2)
+            if len(parts) != 3 or parts[0] == 'timestamp':
+                continue
+            timestamp, event = parts[0], parts[1]
+            lines += 1
+            counts[event] = counts.get(event, 0) + 1
+            minute = timestamp[:16]
+            histogram[minute] = histogram.get(minute, 0) + 1
+            if first is None or timestamp < first:
+                first = timestamp
+            if last is None or timestamp > last:
+                last = timestamp
+
+    stats.files += 1
+    stats.lines += lines
+    stats.first = first
+    stats.last = last
+
+
+# 작업 프로세스에서 실행: 할당된 파일들을 집계하여 부분 결과 반환
+def collect_shard(paths):
+    stats = LogStats()
+    for path in paths:
+        collect_file(path, stats)
+    return stats
+
+
+# 파일 크기가 고르게 나뉘도록 큰 파일부터 가장 가벼운 묶음에 배정
+def make_shards(paths, shard_count):
+    shards = [[] for _ in range(shard_count)]
+    sizes = [0] * shard_count
+    for path in sorted(paths, key=os.path.getsize, reverse=True):
+        lightest = sizes.index(min(sizes))
+        shards[lightest].append(path)
+        sizes[lightest] += os.path.getsize(path)
+    return [shard for shard in shards if shard]
+
+
+# 여러 로그 파일을 프로세스 풀로 나누어 집계한 뒤 하나로 합침
+def aggregate(paths, workers=None):
+    workers = workers or os.cpu_count() or 1
+    shards = make_shards(paths, min(workers, len(paths)) or 1)
+    total = LogStats()
+
+    if len(shards) <= 1:
+        for shard in shards:
+            total.merge(collect_shard(shard))
+        return total
+
+    with ProcessPoolExecutor(max_workers=len(shards)) as executor:
+        for stats in executor.map(collect_shard, shards):
+            total.merge(stats)
+    return total
+
+
+# 'mission_computer_main*.log' 같은 패턴에 맞는 파일 목록
+def find_log_files(pattern):
+    return sorted(path for path in glob.glob(pattern) if os.path.isfile(path))
+
+
+# 집계 결과를 요약표 문자열로 변환
+def format_summary(stats, top_minutes=10):
+    lines = [
+        f'파일 수: {stats.files}',
+        f'로그 줄 수: {stats.lines}',
+        f'처음 기록: {stats.first}',
+        f'마지막 기록: {stats.last}',
+        '',
+        f'{"이벤트":<7}{"건수":>10}',  # 한글은 두 칸 폭이라 칸 수를 맞춤
+        '-' * 24,
+    ]
+    events = EVENT_LEVELS + sorted(event for event in stats.counts if event not in EVENT_LEVELS)
+    for event in events:
+        lines.append(f'{event:<10}{stats.counts.get(event, 0):>12}')
+
+    busiest = sorted(stats.histogram.items(), key=lambda item: (-item[1], item[0]))[:top_minutes]
+    if busiest:
+        lines += ['', f'[ 로그가 가장 많은 시간대 (분 단위, 상위 {len(busiest)}개) ]']
+        for minute, count in busiest:
+            lines.append(f'  {minute}  {count}')
+    return '\n'.join(lines)
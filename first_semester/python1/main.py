@@ -1,23 +1,128 @@
 # main.py
 
+import argparse
+import os
+
+from log_follow import follow
+from log_index import query_range
+from log_stats import aggregate, find_log_files, format_summary
+
+# 뒤에서부터 한 번에 읽어 들일 블록 크기 (64KB)
+BLOCK_SIZE = 64 * 1024
+
+# 로그 파일 열기 (내용은 한꺼번에 읽지 않고 필요할 때 블록 단위로 읽음)
 def read_log_file(file_path):
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            return file.readlines()
+        return open(file_path, 'rb')
     except (FileNotFoundError, PermissionError) as e:
         print(f'오류: {e}')
     except Exception as e:
         print(f'예상하지 못한 오류 발생: {e}')
     return None
 
+# 파일 끝에서부터 고정 크기 블록을 거꾸로 읽으며 한 줄씩 반환 (최신순)
+# 메모리에는 블록 하나와 아직 잘리지 않은 줄 조각만 유지된다.
+def read_lines_reversed(file, block_size=BLOCK_SIZE):
+    file.seek(0, os.SEEK_END)
+    position = file_size = file.tell()
+    remainder = b''
+    at_end = True
+
+    while position > 0:
+        read_size = min(block_size, position)
+        position -= read_size
+        file.seek(position)
+        lines = (file.read(read_size) + remainder).split(b'\n')
+
+        # 첫 조각은 앞 블록과 이어질 수 있으므로 다음 블록까지 보류
+        remainder = lines[0]
+        tail = lines[1:]
+
+        # 파일이 줄바꿈으로 끝나면 마지막 빈 조각은 줄이 아님
+        if at_end and tail and tail[-1] == b'':
+            tail.pop()
+        at_end = False
+
+        for line in reversed(tail):
+            yield line.rstrip(b'\r').decode('utf-8')
+
+    # 파일 맨 앞의 첫 줄 (빈 파일이 아니면 항상 존재)
+    if file_size > 0:
+        yield remainder.rstrip(b'\r').decode('utf-8')
+
+# 명령행 인자 정의
+def parse_args():
+    parser = argparse.ArgumentParser(description='화성 기지 미션 컴퓨터 로그 뷰어')
+    parser.add_argument('log_path', nargs='?', default='mission_computer_main.log', help='로그 파일 경로')
+    parser.add_argument('--from', dest='start', help="조회 시작 시각 (예: '2023-08-27 10:05')")
+    parser.add_argument('--to', dest='end', help="조회 종료 시각 (예: '2023-08-27 10:30')")
+    parser.add_argument('--follow', action='store_true', help='새로 추가되는 로그만 계속 출력')
+    parser.add_argument('--stats', nargs='?', const='mission_computer_main*.log', metavar='PATTERN',
+                        help='패턴에 맞는 여러 로그 파일의 이벤트 통계 요약 (기본: mission_computer_main*.log)')
+    parser.add_argument('--workers', type=int, help='--stats 집계에 사용할 프로세스 수 (기본: CPU 코어 수)')
+    return parser.parse_args()
+
+# 인덱스를 이용해 지정한 시간 범위의 로그만 출력
+def print_range(log_path, start, end):
+    print(f'\n[ {start} ~ {end} 로그 출력 ]\n')
+    try:
+        for record in query_range(log_path, start, end):
+            print(record)
+    except (FileNotFoundError, PermissionError) as e:
+        print(f'오류: {e}')
+    except Exception as e:
+        print(f'예상하지 못한 오류 발생: {e}')
+
+# 마지막으로 처리한 위치 이후에 추가된 로그만 계속 출력
+def print_follow(log_path):
+    print('\n[ 새 로그 대기 중 (종료: Ctrl + C) ]\n')
+    try:
+        for line in follow(log_path):
+            print(line, flush=True)
+    except (FileNotFoundError, PermissionError) as e:
+        print(f'오류: {e}')
+    except KeyboardInterrupt:
+        print('\n로그 감시를 종료합니다.')
+
+# 여러 로그 파일을 병렬로 집계하여 요약표 출력
+def print_stats(pattern, workers):
+    paths = find_log_files(pattern)
+    if not paths:
+        print(f'오류: "{pattern}"에 해당하는 로그 파일이 없습니다.')
+        return
+    print(f'\n[ 로그 통계 요약 ({len(paths)}개 파일) ]\n')
+    try:
+        print(format_summary(aggregate(paths, workers)))
+    except (FileNotFoundError, PermissionError) as e:
+        print(f'오류: {e}')
+    except Exception as e:
+        print(f'예상하지 못한 오류 발생: {e}')
+
 def main():
+    args = parse_args()
     print('Hello Mars')
 
-    log_content = read_log_file('mission_computer_main.log')
-    if log_content:  
-        print('\n[ 로그 파일 내용 출력 (최신순) ]\n')
-        for line in reversed(log_content):
-            print(line, end='')
+    if args.stats:
+        print_stats(args.stats, args.workers)
+        return
+
+    if args.follow:
+        print_follow(args.log_path)
+        return
+
+    if args.start or args.end:
+        print_range(args.log_path, args.start or '', args.end or '9999')
+        return
+
+    log_file = read_log_file(args.log_path)
+    if log_file:
+        with log_file:
+            print('\n[ 로그 파일 내용 출력 (최신순) ]\n')
+            try:
+                for line in read_lines_reversed(log_file):
+                    print(line)
+            except UnicodeDecodeError as e:
+                print(f'오류: 로그 파일 인코딩 해석 실패 ({e})')
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,161 @@
+# binary_format.py
+# 화물 목록을 고정 길이 레코드로 저장하는 이진 파일 형식
+#
+# [헤더]      매직(4s) 버전(H) 컬럼 수(H) 행 수(I) 문자열 수(I) 레코드 시작 위치(Q)
+# [스키마]    컬럼마다 타입(B: 0=문자열, 1=float64) + 컬럼 이름의 문자열 번호(I)
+# [문자열표]  문자열마다 바이트 길이(I) + UTF-8 바이트
+# [레코드]    행마다 문자열 컬럼은 문자열 번호(I), 숫자 컬럼은 float64(d)
+
+import mmap
+import struct
+
+MAGIC = b'MINV'
+VERSION = 1
+TYPE_STRING = 0
+TYPE_FLOAT = 1
+
+HEADER = struct.Struct('<4sHHIIQ')
+COLUMN = struct.Struct('<BI')
+LENGTH = struct.Struct('<I')
+
+
+# 컬럼 타입 목록으로 레코드 구조(struct) 생성 (예: '<IIIId')
+def record_struct(types):
+    return struct.Struct('<' + ''.join('d' if t == TYPE_FLOAT else 'I' for t in types))
+
+
+# 인덱스 배열 순서대로 행을 이진 파일로 저장
+# numeric_columns에 속한 컬럼은 float64로, 나머지는 문자열표 번호로 저장한다.
+def write_inventory(filename, inventory, indices, numeric_columns):
+    headers = inventory.headers
+    types = [TYPE_FLOAT if h in numeric_columns else TYPE_STRING for h in headers]
+
+    # 컬럼 이름과 모든 문자열 값을 중복 없이 문자열표에 등록
+    strings = []
+    string_ids = {}
+
+    def intern(value):
+        string_id = string_ids.get(value)
+        if string_id is None:
+            string_id = string_ids[value] = len(strings)
+            strings.append(value)
+        return string_id
+
+    name_ids = [intern(h) for h in headers]
+    columns = [inventory.columns[h] for h in headers]
+
+    # 레코드를 만들면서 문자열을 등록하므로 문자열표는 레코드를 다 만든 뒤 계산
+    record = record_struct(types)
+    records = bytearray()
+    for i in indices:
+        values = [
+            column[i] if t == TYPE_FLOAT else intern(column[i])
+            for column, t in zip(columns, types)
+        ]
+        records += record.pack(*values)
+    encoded = [s.encode('utf-8') for s in strings]
+
+    schema = b''.join(COLUMN.pack(t, name_id) for t, name_id in zip(types, name_ids))
+    table = b''.join(LENGTH.pack(len(b)) + b for b in encoded)
+    record_offset = HEADER.size + len(schema) + len(table)
+
+    with open(filename, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, len(headers), len(indices), len(strings), record_offset))
+        file.write(schema)
+        file.write(table)
+        file.write(records)
+
+
+# 이진 파일을 메모리 매핑하여 레코드를 필요할 때만 해석하는 읽기 객체
+# reader[n]은 n번째 레코드를 바로 계산된 위치에서 읽으므로 O(1)이다.
+class InventoryReader:
+    def __init__(self, filename):
+        with open(filename, 'rb') as file:
+            self._mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version, column_count, self.row_count, string_count, self._record_offset = (
+                HEADER.unpack_from(self._mm, 0)
+            )
+            if magic != MAGIC or version != VERSION:
+                raise ValueError('화물 목록 이진 파일 형식이 아닙니다.')
+
+            position = HEADER.size
+            schema = []
+            for _ in range(column_count):
+                schema.append(COLUMN.unpack_from(self._mm, position))
+                position += COLUMN.size
+
+            self.strings = []
+            for _ in range(string_count):
+                (length,) = LENGTH.unpack_from(self._mm, position)
+                position += LENGTH.size
+                self.strings.append(self._mm[position:position + length].decode('utf-8'))
+                position += length
+        except Exception:
+            self._mm.close()
+            raise
+
+        self.types = [t for t, _ in schema]
+        self.headers = [self.strings[name_id] for _, name_id in schema]
+        self._record = record_struct(self.types)
+
+    def __len__(self):
+        return self.row_count
+
+    # 레코드의 문자열 번호를 실제 문자열로 바꿔 값 목록으로 반환
+    def _decode(self, values):
+        strings = self.strings
+        return [v if t == TYPE_FLOAT else strings[v] for v, t in zip(values, self.types)]
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.row_count
+        if not 0 <= index < self.row_count:
+            raise IndexError('레코드 번호가 범위를 벗어났습니다.')
+        return self._decode(self._record.unpack_from(self._mm, self.record_position(index)))
+
+    # 레코드 영역을 복사하지 않고 매핑된 메모리에서 바로 순서대로 해석
+    def __iter__(self):
+        record = self._record
+        end = self._record_offset + self.row_count * record.size
+        for position in range(self._record_offset, end, record.size):
+            yield self._decode(record.unpack_from(self._mm, position))
+
+    # n번째 레코드가 시작하는 파일 위치
+    def record_position(self, index):
+        return self._record_offset + index * self._record.size
+
+    def close(self):
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# (레코드 번호, 값 목록) 목록으로 레코드를 제자리에서 덮어씀 (성공하면 True)
+# 문자열표에 없는 값이 하나라도 있으면 파일을 건드리지 않고 False를 반환한다.
+def patch_records(filename, replacements):
+    with InventoryReader(filename) as reader:
+        string_ids = {s: i for i, s in enumerate(reader.strings)}
+        record = reader._record
+        patches = []
+        for index, values in replacements:
+            packed = []
+            for value, t in zip(values, reader.types):
+                if t == TYPE_FLOAT:
+                    packed.append(float(value))
+                elif value in string_ids:
+                    packed.append(string_ids[value])
+                else:
+                    return False
+            patches.append((reader.record_position(index), record.pack(*packed)))
+
+    with open(filename, 'r+b') as file:
+        for position, data in patches:
+            file.seek(position)
+            file.write(data)
+    return True
@@ -0,0 +1,186 @@
+# inventory_diff.py
+# 행마다 내용 해시를 저장해 두고, 새 화물 목록과 비교하여 추가/삭제/변경된 행만 찾는다.
+# 행을 구분하는 기준은 첫 번째 컬럼(Substance)이며, 같은 이름이 여러 번 나오면
+# 두 번째부터 'Sulfuric Acid#2'처럼 등장 순서를 붙여 구분한다.
+
+import hashlib
+import os
+from collections import Counter
+
+from binary_format import InventoryReader, patch_records
+
+
+# 화물 목록 옆에 두는 해시 인덱스 파일 경로
+def hash_index_path_for(csv_path):
+    return os.path.splitext(csv_path)[0] + '.hash'
+
+
+# 인화성 지수를 float 문자열로 맞춘 행 (위험 목록 CSV와 이진 파일에 저장되는 형태와 같음)
+def normalize_fields(fields, flammability_index):
+    fields = list(fields)
+    fields[flammability_index] = str(float(fields[flammability_index]))
+    return fields
+
+
+# 정규화한 행의 내용 해시 (8바이트 BLAKE2b, 16진수 문자열)
+# 원본 CSV, 위험 목록 CSV, 이진 파일의 같은 행은 모두 같은 해시를 가진다.
+def row_hash(fields):
+    return hashlib.blake2b(','.join(map(str, fields)).encode('utf-8'), digest_size=8).hexdigest()
+
+
+# 해시 인덱스 파일 읽기 (없으면 None)
+def load_hash_index(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            return dict(line.rstrip('\n').split('\t', 1) for line in file if line.strip())
+    except FileNotFoundError:
+        return None
+
+
+# 해시 인덱스 파일 삭제 (결과 파일을 인덱스 없이 다시 만들었을 때 다음 --incremental이 전체 처리하도록)
+def invalidate_hash_index(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+# 해시 인덱스 파일 저장 (임시 파일에 쓴 뒤 교체)
+def save_hash_index(path, hashes):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as file:
+        file.writelines(f'{key}\t{value}\n' for key, value in hashes.items())
+    os.replace(tmp_path, path)
+
+
+# 새 화물 목록과 이전 해시 인덱스의 차이
+# added/changed: 행 이름 → 정규화한 필드 목록, removed: 행 이름 집합
+# stale: 더 이상 유효하지 않은 이전 행들의 해시 (삭제/변경된 행), hashes: 새 해시 인덱스
+# positions: 행 이름 → 새 화물 목록에서의 행 번호 (위험 목록을 전체 처리와 같은 순서로 정렬할 때 사용)
+class InventoryDiff:
+    def __init__(self, headers, added, changed, removed, stale, hashes, positions):
+        self.headers = headers
+        self.added = added
+        self.changed = changed
+        self.removed = removed
+        self.stale = stale
+        self.hashes = hashes
+        self.positions = positions
+
+    def __bool__(self):
+        return bool(self.added or self.changed or self.removed)
+
+
+# CSV를 한 줄씩 해시하여 이전 인덱스와 비교 (바뀐 행의 필드만 메모리에 유지)
+def diff_manifest(csv_path, old_hashes):
+    added = {}
+    changed = {}
+    hashes = {}
+    positions = {}
+    occurrences = Counter()
+
+    with open(csv_path, 'r', encoding='utf-8') as file:
+        headers = file.readline().strip().split(',')
+        flammability_index = headers.index('Flammability')
+        for line in file:
+            line = line.strip()
+            if not line:
+                continue
+            fields = normalize_fields(line.split(','), flammability_index)
+            occurrences[fields[0]] += 1
+            count = occurrences[fields[0]]
+            key = fields[0] if count == 1 else f'{fields[0]}#{count}'
+
+            positions[key] = len(positions)
+            digest = hashes[key] = row_hash(fields)
+            old_digest = old_hashes.get(key)
+            if old_digest is None:
+                added[key] = fields
+            elif old_digest != digest:
+                changed[key] = fields
+
+    removed = set(old_hashes) - set(hashes)
+    stale = Counter(old_hashes[key] for key in removed | set(changed))
+    return InventoryDiff(headers, added, changed, removed, stale, hashes, positions)
+
+
+# 위험 목록 CSV에 차이만 반영 (삭제/변경된 행을 빼고, 새 값이 threshold 이상이면 다시 넣음)
+# 인화성 지수가 같은 행은 새 화물 목록의 행 순서대로 놓이므로 전체를 다시 처리한 결과와 같다.
+# 위험 목록에 해시 인덱스로 설명되지 않는 행이 있으면 (인덱스 없이 결과 파일을 다시 만든 경우 등)
+# 파일을 고치지 않고 None을 반환하므로, 호출한 쪽에서 전체를 다시 처리한다.
+def update_danger_csv(danger_path, diff, threshold=0.7):
+    flammability_index = diff.headers.index('Flammability')
+    stale = Counter(diff.stale)
+    kept = []
+
+    # 바뀌지 않은 행의 해시 → 새 화물 목록에서의 행 번호들 (내용이 같은 행이 여러 개면 앞에서부터 배정)
+    unchanged_positions = {}
+    for key, digest in diff.hashes.items():
+        if key not in diff.added and key not in diff.changed:
+            unchanged_positions.setdefault(digest, []).append(diff.positions[key])
+    for positions in unchanged_positions.values():
+        positions.reverse()
+
+    with open(danger_path, 'r', encoding='utf-8') as file:
+        header = file.readline()
+        for line in file:
+            if not line.strip():
+                continue
+            fields = line.strip().split(',')
+            digest = row_hash(fields)
+            if stale[digest] > 0:
+                stale[digest] -= 1
+                continue
+            positions = unchanged_positions.get(digest)
+            if not positions:
+                return None
+            kept.append((positions.pop(), fields))
+
+    incoming = [
+        (diff.positions[key], fields)
+        for key, fields in list(diff.added.items()) + list(diff.changed.items())
+        if float(fields[flammability_index]) >= threshold
+    ]
+
+    rows = kept + incoming
+    rows.sort(key=lambda row: (-float(row[1][flammability_index]), row[0]))
+    rows = [fields for _, fields in rows]
+
+    tmp_path = danger_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as file:
+        file.write(header)
+        file.writelines(','.join(fields) + '\n' for fields in rows)
+    os.replace(tmp_path, danger_path)
+    return len(rows)
+
+
+# 이진 파일의 레코드를 제자리에서 고쳐 씀 (성공하면 True)
+# 이진 파일은 인화성 순으로 정렬되어 있으므로 행 추가/삭제나 인화성 지수 변경처럼
+# 레코드 위치가 바뀌어야 하면 False를 반환하고, 호출한 쪽에서 파일을 다시 만든다.
+def patch_binary(bin_path, diff, old_hashes):
+    if diff.added or diff.removed:
+        return False
+
+    flammability_index = diff.headers.index('Flammability')
+    pending = {}
+    for key, fields in diff.changed.items():
+        pending.setdefault(old_hashes[key], []).append(fields)
+
+    replacements = []
+    with InventoryReader(bin_path) as reader:
+        if reader.headers != diff.headers:
+            return False
+        for index, values in enumerate(reader):
+            candidates = pending.get(row_hash(values))
+            if not candidates:
+                continue
+            fields = candidates.pop()
+            new_values = list(fields)
+            new_values[flammability_index] = float(fields[flammability_index])
+            if new_values[flammability_index] != values[flammability_index]:
+                return False
+            replacements.append((index, new_values))
+
+    if any(pending.values()):
+        return False
+    return patch_records(bin_path, replacements)
@@ -1,98 +1,273 @@
 # main.py
 
-# CSV 파일을 읽고, 목록을 리스트로 변환
+import argparse
+import heapq
+import os
+from array import array
+
+from binary_format import InventoryReader, write_inventory
+from inventory_diff import (
+    diff_manifest, hash_index_path_for, invalidate_hash_index, load_hash_index, patch_binary, save_hash_index,
+    update_danger_csv
+)
+from stream_pipeline import CHUNK_ROWS, run_streaming
+
+# 숫자(float64)로 저장할 컬럼
+NUMERIC_COLUMNS = {'Flammability'}
+
+
+# 문자열 컬럼: 서로 다른 값은 한 번만 저장하고 각 행에는 값 번호(코드)만 저장
+class CategoricalColumn:
+    def __init__(self):
+        self.categories = []   # 코드 → 값
+        self.lookup = {}       # 값 → 코드
+        self.codes = array('I')
+
+    def append(self, value):
+        code = self.lookup.get(value)
+        if code is None:
+            code = len(self.categories)
+            self.categories.append(value)
+            self.lookup[value] = code
+        self.codes.append(code)
+
+    def __getitem__(self, index):
+        return self.categories[self.codes[index]]
+
+    def __len__(self):
+        return len(self.codes)
+
+
+# 컬럼 단위로 저장한 화물 목록 (행마다 dict를 만들지 않음)
+class Inventory:
+    def __init__(self, headers):
+        self.headers = headers
+        self.columns = {
+            h: array('d') if h in NUMERIC_COLUMNS else CategoricalColumn()
+            for h in headers
+        }
+
+    def __len__(self):
+        return len(self.columns[self.headers[0]]) if self.headers else 0
+
+    # 한 행을 컬럼별로 나누어 추가
+    # 컬럼 수가 헤더와 다르거나 숫자 변환에 실패하면 어느 컬럼에도 추가하지 않고 ValueError를 발생시킨다.
+    def append_row(self, fields):
+        if len(fields) != len(self.headers):
+            raise ValueError(f'컬럼 수가 헤더와 다른 행: {",".join(fields)}')
+        values = [float(field) if header in NUMERIC_COLUMNS else field for header, field in zip(self.headers, fields)]
+        for header, value in zip(self.headers, values):
+            self.columns[header].append(value)
+
+    # i번째 행의 값 목록 (헤더 순서)
+    def row(self, index):
+        return [self.columns[h][index] for h in self.headers]
+
+    # 인덱스 배열 순서대로 행을 '헤더: 값' 문자열로 변환 (indices가 없으면 원래 순서)
+    def format_rows(self, indices=None):
+        indices = range(len(self)) if indices is None else indices
+        return (', '.join(f'{h}: {v}' for h, v in zip(self.headers, self.row(i))) for i in indices)
+
+
+# CSV 파일을 읽어 컬럼 단위 목록으로 변환
 def read_csv(filename):
     try:
         with open(filename, 'r', encoding='utf-8') as file:
-            lines = file.readlines()
+            # 첫 번째 줄(헤더) 가져오기
+            headers = file.readline().strip().split(',')
+            inventory = Inventory(headers)
 
-        # 첫 번째 줄(헤더) 가져오기
-        headers = lines[0].strip().split(',')
+            # 한 줄씩 읽어 컬럼에 추가 (파일 전체를 줄 목록으로 만들지 않음)
+            for line in file:
+                line = line.strip()
+                if line:
+                    inventory.append_row(line.split(','))
 
-        # 데이터 변환 (리스트 컴프리헨션 활용)
-        data = [
-            {headers[i]: (float(fields[i]) if headers[i] == 'Flammability' else fields[i]) for i in range(len(headers))}
-            for line in lines[1:] if (fields := line.strip().split(','))
-        ]
-
-        return data
+        return inventory
 
     except (FileNotFoundError, PermissionError) as e:
         print(f'오류: {e}')
-    except ValueError:
-        print('오류: CSV 파일 내 숫자 변환 실패')
+    except ValueError as e:
+        print(f'오류: CSV 파일 형식 또는 숫자 변환 실패 ({e})')
     except Exception as e:
         print(f'예상하지 못한 오류 발생: {e}')
     
     return None
 
-# 리스트를 인화성 지수가 높은 순으로 정렬
-def sort_by_flammability(items):
-    return sorted(items, key=lambda x: x['Flammability'], reverse=True)
+# 인화성 지수가 높은 순으로 정렬한 행 인덱스 배열 반환
+def sort_by_flammability(inventory, indices=None):
+    flammability = inventory.columns['Flammability']
+    indices = range(len(inventory)) if indices is None else indices
+    return array('I', sorted(indices, key=flammability.__getitem__, reverse=True))
+
+# 인화성 지수가 0.7 이상인 행 인덱스 배열 반환
+def filter_dangerous_items(inventory, indices=None):
+    flammability = inventory.columns['Flammability']
+    indices = range(len(inventory)) if indices is None else indices
+    return array('I', (i for i in indices if flammability[i] >= 0.7))
 
-# 인화성 지수가 0.7 이상인 항목 필터링
-def filter_dangerous_items(items):
-    return [item for item in items if item['Flammability'] >= 0.7]
+# 인화성 지수가 threshold 이상인 행만 먼저 골라낸 뒤, 높은 순으로 정렬한 인덱스 배열 반환
+# top_n을 지정하면 전체 정렬 없이 힙으로 상위 N개만 뽑는다 (sorted(...)[:top_n]과 같은 결과).
+def query_dangerous(inventory, threshold=0.7, top_n=None):
+    flammability = inventory.columns['Flammability']
+    matched = array('I', (i for i, value in enumerate(flammability) if value >= threshold))
+    if top_n is not None:
+        return array('I', heapq.nlargest(top_n, matched, key=flammability.__getitem__))
+    return array('I', sorted(matched, key=flammability.__getitem__, reverse=True))
 
-# 리스트를 CSV 파일로 저장 (모든 컬럼 포함)
-def save_to_csv(filename, headers, items):
+# 인덱스 배열 순서대로 행을 CSV 파일로 저장 (모든 컬럼 포함, 성공하면 True)
+def save_to_csv(filename, inventory, indices):
     try:
         with open(filename, 'w', encoding='utf-8') as file:
-            file.write(','.join(headers) + '\n')
-            file.writelines(','.join(str(item[h]) for h in headers) + '\n' for item in items)
+            file.write(','.join(inventory.headers) + '\n')
+            file.writelines(','.join(str(v) for v in inventory.row(i)) + '\n' for i in indices)
         print(f'\n"{filename}" 파일이 생성되었습니다.')
+        return True
     except Exception as e:
         print(f'오류 발생: {e}')
+        return False
 
-# 리스트를 텍스트 기반의 이진 파일(.bin)로 저장      
-def save_to_binary_file(filename, items):
+# 인덱스 배열 순서대로 행을 고정 길이 레코드의 이진 파일(.bin)로 저장 (성공하면 True)
+def save_to_binary_file(filename, inventory, indices):
     try:
-        with open(filename, 'wb') as file:
-            for item in items:
-                line = ', '.join(f'{k}: {v}' for k, v in item.items())
-                file.write((line + '\n').encode('utf-8'))
+        write_inventory(filename, inventory, indices, NUMERIC_COLUMNS)
         print(f'\n"{filename}" 이진 파일이 생성되었습니다.')
+        return True
     except Exception as e:
         print(f'이진 파일 저장 중 오류 발생: {e}')
+        return False
 
-# 이진 파일 출력    
+# 이진 파일을 메모리 매핑하여 레코드를 하나씩 해석하며 출력
 def read_from_binary_file(filename):
     try:
-        with open(filename, 'rb') as file:
-            lines = file.readlines()
-        print(f'\n=== 이진 파일 "{filename}"의 내용 ===')
-        for line in lines:
-            print(line.decode('utf-8').strip())
+        with InventoryReader(filename) as reader:
+            print(f'\n=== 이진 파일 "{filename}"의 내용 ===')
+            for values in reader:
+                print(', '.join(f'{h}: {v}' for h, v in zip(reader.headers, values)))
     except Exception as e:
         print(f'이진 파일 읽기 중 오류 발생: {e}')
 
-# 파일 읽기
-inventory = read_csv('Mars_Base_Inventory_List.csv')
+# 명령행 인자 정의
+def parse_args():
+    parser = argparse.ArgumentParser(description='화성 기지 화물 목록 위험물 분류')
+    parser.add_argument('--stream', action='store_true',
+                        help='목록 전체를 메모리에 올리지 않고 청크 단위로 위험 목록 CSV만 생성')
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS, help='--stream에서 한 번에 처리할 행 수')
+    parser.add_argument('--unsorted', action='store_true', help='--stream에서 정렬 없이 원래 순서대로 저장')
+    parser.add_argument('--incremental', action='store_true',
+                        help='이전 실행 이후 추가/삭제/변경된 항목만 위험 목록 CSV와 이진 파일에 반영')
+    return parser.parse_args()
 
-if inventory:
-    
-    # 인화성이 높은 순으로 정렬
-    sorted_inventory = sort_by_flammability(inventory)
+# 결과 파일을 다시 만든 뒤 해시 인덱스를 원본 목록에 맞춰 저장
+# 결과 파일 저장에 실패했으면 인덱스를 저장하지 않으므로 다음 --incremental은 전체를 다시 처리한다.
+def refresh_hash_index(csv_path, saved):
+    if saved:
+        save_hash_index(hash_index_path_for(csv_path), diff_manifest(csv_path, {}).hashes)
+
+# 전체 목록으로 위험 목록 CSV와 이진 파일을 다시 만들고 해시 인덱스 저장
+def rebuild_all(csv_path, danger_path, bin_path):
+    invalidate_hash_index(hash_index_path_for(csv_path))
+    inventory = read_csv(csv_path)
+    if not inventory:
+        return
+    saved = save_to_csv(danger_path, inventory, query_dangerous(inventory, 0.7))
+    saved = save_to_binary_file(bin_path, inventory, sort_by_flammability(inventory)) and saved
+    refresh_hash_index(csv_path, saved)
+
+# 이전 실행의 해시 인덱스와 비교하여 바뀐 항목만 결과 파일에 반영
+def run_incremental(csv_path, danger_path, bin_path):
+    try:
+        hash_path = hash_index_path_for(csv_path)
+        old_hashes = load_hash_index(hash_path)
+
+        # 처음 실행하거나 결과 파일이 없으면 전체 처리 후 해시 인덱스 생성
+        if old_hashes is None or not os.path.exists(danger_path) or not os.path.exists(bin_path):
+            print('\n이전 해시 인덱스가 없어 전체 목록을 처리합니다.')
+            rebuild_all(csv_path, danger_path, bin_path)
+            return
+
+        diff = diff_manifest(csv_path, old_hashes)
+        if not diff:
+            print('\n변경된 항목이 없습니다.')
+            return
+
+        print(f'\n=== 변경 내역: 추가 {len(diff.added)}건, 삭제 {len(diff.removed)}건, 변경 {len(diff.changed)}건 ===')
+        for label, keys in (('+', diff.added), ('-', sorted(diff.removed)), ('*', diff.changed)):
+            for key in keys:
+                print(f'  {label} {key}')
+
+        count = update_danger_csv(danger_path, diff, 0.7)
+        if count is None:
+            print(f'\n"{danger_path}" 파일이 해시 인덱스와 맞지 않아 전체 목록을 처리합니다.')
+            rebuild_all(csv_path, danger_path, bin_path)
+            return
+        print(f'\n"{danger_path}" 파일에 변경 내역을 반영했습니다. (위험 화물 {count}건)')
+
+        # 레코드 위치가 그대로면 제자리 수정, 아니면 이진 파일을 다시 생성
+        if patch_binary(bin_path, diff, old_hashes):
+            print(f'\n"{bin_path}" 이진 파일의 레코드 {len(diff.changed)}건을 제자리에서 수정했습니다.')
+        else:
+            inventory = read_csv(csv_path)
+            if not inventory:
+                return
+            save_to_binary_file(bin_path, inventory, sort_by_flammability(inventory))
+
+        save_hash_index(hash_path, diff.hashes)
+    except (FileNotFoundError, PermissionError) as e:
+        print(f'오류: {e}')
+    except ValueError:
+        print('오류: CSV 파일 형식 또는 숫자 변환 실패')
+    except Exception as e:
+        print(f'예상하지 못한 오류 발생: {e}')
+
+def main():
+    args = parse_args()
+    if args.stream:
+        # 위험 목록 CSV만 다시 만들므로 해시 인덱스는 지워서 다음 --incremental이 전체 처리하도록 함
+        invalidate_hash_index(hash_index_path_for('Mars_Base_Inventory_List.csv'))
+        run_streaming('Mars_Base_Inventory_List.csv', 'Mars_Base_Inventory_danger.csv',
+                      chunk_rows=args.chunk_rows, sort=not args.unsorted)
+        return
+
+    if args.incremental:
+        run_incremental('Mars_Base_Inventory_List.csv', 'Mars_Base_Inventory_danger.csv', 'Mars_Base_Inventory_List.bin')
+        return
+
+    # 결과 파일을 다시 만드는 동안 이전 해시 인덱스가 남지 않도록 먼저 지움
+    invalidate_hash_index(hash_index_path_for('Mars_Base_Inventory_List.csv'))
+
+    # 파일 읽기
+    inventory = read_csv('Mars_Base_Inventory_List.csv')
+
+    if inventory:
+        # 인화성이 높은 순으로 정렬 (행 인덱스 배열)
+        sorted_indices = sort_by_flammability(inventory)
+
+        # 인화성 지수 0.7 이상만 골라 높은 순으로 정렬
+        dangerous_indices = query_dangerous(inventory, 0.7)
+
+        # 결과 출력 (모든 컬럼 유지)
+        print('\n=== 원본 CSV 파일 내용 ===')
+        for line in inventory.format_rows():
+            print(line)
 
-    # 인화성 지수 0.7 이상 필터링
-    dangerous_items = filter_dangerous_items(sorted_inventory)
+        print('\n=== 정렬된 화물 목록 (인화성 높은 순) ===')
+        print('\n'.join(inventory.format_rows(sorted_indices)))
 
-    # 결과 출력 (모든 컬럼 유지)
-    print('\n=== 원본 CSV 파일 내용 ===')
-    for item in inventory:
-        print(', '.join(f"{k}: {v}" for k, v in item.items()))
+        print('\n=== 인화성 0.7 이상 화물 목록 ===')
+        print('\n'.join(inventory.format_rows(dangerous_indices)))
 
-    print('\n=== 정렬된 화물 목록 (인화성 높은 순) ===')
-    print('\n'.join(', '.join(f"{k}: {v}" for k, v in item.items()) for item in sorted_inventory))
+        # 위험 목록 CSV 파일 저장 (모든 컬럼 포함)
+        saved = save_to_csv('Mars_Base_Inventory_danger.csv', inventory, dangerous_indices)
 
-    print('\n=== 인화성 0.7 이상 화물 목록 ===')
-    print('\n'.join(', '.join(f"{k}: {v}" for k, v in item.items()) for item in dangerous_items))
+        # 이진 파일 저장 (고정 길이 레코드)
+        saved = save_to_binary_file('Mars_Base_Inventory_List.bin', inventory, sorted_indices) and saved
 
-    # 위험 목록 CSV 파일 저장 (모든 컬럼 포함)
-    save_to_csv('Mars_Base_Inventory_danger.csv', inventory[0].keys(), dangerous_items)
+        # 다음 --incremental이 이번 결과 파일을 기준으로 비교하도록 해시 인덱스 저장
+        refresh_hash_index('Mars_Base_Inventory_List.csv', saved)
 
-    # 이진 파일 저장 (UTF-8 인코딩된 텍스트 기반)
-    save_to_binary_file('Mars_Base_Inventory_List.bin', sorted_inventory)
+        # 이진 파일 출력
+        read_from_binary_file('Mars_Base_Inventory_List.bin')
 
-    # 이진 파일 출력
-    read_from_binary_file('Mars_Base_Inventory_List.bin')
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+# query_bench.py
+# 합성 화물 목록으로 '전체 정렬 후 필터링'과 query_dangerous 속도를 비교한다.
+# 사용법: python query_bench.py [행 수 ...]  (기본: 1백만, 1천만, 5천만)
+
+import random
+import sys
+import time
+from array import array
+
+from main import Inventory, filter_dangerous_items, query_dangerous, sort_by_flammability
+
+
+# 인화성 지수만 무작위로 채운 합성 목록 생성
+def make_inventory(row_count):
+    inventory = Inventory(['Flammability'])
+    inventory.columns['Flammability'] = array('d', (random.random() for _ in range(row_count)))
+    return inventory
+
+
+# 함수 실행 시간(초)과 결과 반환
+def measure(func, *args, **kwargs):
+    begin = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - begin, result
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000_000, 10_000_000, 50_000_000]
+
+    for row_count in sizes:
+        inventory = make_inventory(row_count)
+        print(f'\n[ {row_count:,}행 ]')
+
+        baseline, expected = measure(
+            lambda: filter_dangerous_items(inventory, sort_by_flammability(inventory))
+        )
+        print(f'  정렬 후 필터링      : {baseline:.3f}초')
+
+        elapsed, result = measure(query_dangerous, inventory, 0.7)
+        if result != expected:
+            print('오류: 결과가 다릅니다.')
+            return
+        print(f'  필터링 후 정렬      : {elapsed:.3f}초 ({baseline / elapsed:.1f}배)')
+
+        elapsed, result = measure(query_dangerous, inventory, 0.7, top_n=10)
+        if result != expected[:10]:
+            print('오류: 상위 10개 결과가 다릅니다.')
+            return
+        print(f'  상위 10개 (정렬 없음): {elapsed:.3f}초 ({baseline / elapsed:.1f}배)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+# stream_pipeline.py
+# 화물 목록 CSV를 일정한 행 수(청크) 단위로 읽어 위험 화물만 CSV로 저장한다.
+# 정렬이 필요하면 청크마다 정렬한 결과(run)를 임시 파일로 내보낸 뒤 병합(외부 병합 정렬)하므로
+# 메모리 사용량은 목록 전체가 아니라 청크 크기에 비례한다.
+
+import heapq
+import tempfile
+from itertools import islice
+
+# 한 번에 메모리에 올릴 행 수
+CHUNK_ROWS = 100_000
+
+# 출력 파일 버퍼 크기 (1MB)
+WRITE_BUFFER = 1024 * 1024
+
+
+# 열린 파일에서 청크 단위로 줄 목록을 반환
+def iter_chunks(file, chunk_rows):
+    while True:
+        chunk = list(islice(file, chunk_rows))
+        if not chunk:
+            return
+        yield chunk
+
+
+# 청크에서 인화성 지수가 threshold 이상인 행만 (인화성 지수, CSV 줄)로 변환
+# 숫자는 메모리 방식(main.save_to_csv)과 같게 float 문자열로 다시 기록한다.
+def filter_chunk(chunk, flammability_index, threshold):
+    rows = []
+    for line in chunk:
+        fields = line.strip().split(',')
+        if len(fields) <= flammability_index:
+            continue
+        value = float(fields[flammability_index])
+        if value >= threshold:
+            fields[flammability_index] = str(value)
+            rows.append((value, ','.join(fields) + '\n'))
+    return rows
+
+
+# 정렬된 run 파일을 (인화성 지수, 줄)로 다시 읽음
+def read_run(file, flammability_index):
+    for line in file:
+        yield float(line.split(',')[flammability_index]), line
+
+
+# 청크 단위로 위험 화물을 골라 dst CSV에 저장하고 저장한 행 수를 반환
+# sort=True이면 인화성 높은 순(같으면 원래 순서)으로 저장한다.
+def extract_dangerous(src, dst, threshold=0.7, chunk_rows=CHUNK_ROWS, sort=True):
+    count = 0
+    runs = []
+
+    with open(src, 'r', encoding='utf-8') as reader, \
+            open(dst, 'w', encoding='utf-8', buffering=WRITE_BUFFER) as writer:
+        header = reader.readline()
+        flammability_index = header.strip().split(',').index('Flammability')
+        writer.write(header.strip() + '\n')
+
+        try:
+            for chunk in iter_chunks(reader, chunk_rows):
+                rows = filter_chunk(chunk, flammability_index, threshold)
+                count += len(rows)
+                if not sort:
+                    writer.writelines(line for _, line in rows)
+                    continue
+
+                # 청크 안에서 정렬한 뒤 임시 파일(run)로 내보냄 (sorted는 같은 값의 순서를 유지)
+                rows.sort(key=lambda row: row[0], reverse=True)
+                run = tempfile.TemporaryFile('w+', encoding='utf-8')
+                runs.append(run)
+                run.writelines(line for _, line in rows)
+                run.seek(0)
+
+            if runs:
+                # 앞선 run을 먼저 내보내므로 같은 값은 원래 순서를 유지
+                merged = heapq.merge(
+                    *(read_run(run, flammability_index) for run in runs),
+                    key=lambda row: -row[0],
+                )
+                writer.writelines(line for _, line in merged)
+        finally:
+            for run in runs:
+                run.close()
+
+    return count
+
+
+# 청크 단위 방식으로 위험 목록을 만들고 결과 메시지 출력
+def run_streaming(src, dst, threshold=0.7, chunk_rows=CHUNK_ROWS, sort=True):
+    try:
+        count = extract_dangerous(src, dst, threshold, chunk_rows, sort)
+        print(f'\n"{dst}" 파일이 생성되었습니다. (위험 화물 {count}건, 청크 {chunk_rows}행)')
+    except (FileNotFoundError, PermissionError) as e:
+        print(f'오류: {e}')
+    except ValueError:
+        print('오류: CSV 파일 형식 또는 숫자 변환 실패')
+    except Exception as e:
+        print(f'예상하지 못한 오류 발생: {e}')
@@ -0,0 +1,49 @@
+# batch_sensor.py
+
+import time
+
+import numpy as np
+
+from mars_mission_computer import DummySensor
+
+# 여러 기지의 센서값을 한 번에 생성하는 클래스 (지상국 부하 테스트용)
+# DummySensor의 센서 목록(최소/최대값, 소수점 자리수)을 벡터로 만들어
+# 매 틱마다 (기지 수 × 센서 수) 행렬을 한 번의 호출로 만든다.
+class BatchDummySensor:
+  def __init__(self, base_count, sensors=None, seed=None):
+    self.sensors = sensors if sensors is not None else DummySensor().sensors
+    self.base_count = base_count
+    self.names = [sensor.name for sensor in self.sensors]
+    self.min_vals = np.array([sensor.min_val for sensor in self.sensors], dtype=np.float64)
+    self.max_vals = np.array([sensor.max_val for sensor in self.sensors], dtype=np.float64)
+    self.scales = 10.0 ** np.array([sensor.round_digits for sensor in self.sensors])
+    self.rng = np.random.default_rng(seed)
+
+    # 아직 측정되지 않은 값은 NaN (DummySensor의 None에 해당)
+    self.values = np.full((base_count, len(self.sensors)), np.nan)
+
+  # 모든 기지의 센서값을 한 번에 갱신하고 (기지 수 × 센서 수) 행렬 반환
+  def set_env(self):
+    raw = self.rng.uniform(self.min_vals, self.max_vals, size=self.values.shape)
+    # 센서마다 자리수가 달라 np.round(decimals=...) 대신 배율을 곱해 반올림
+    self.values = np.round(raw * self.scales) / self.scales
+    return self.values
+
+  # 기지 하나의 센서값을 DummySensor.get_env와 같은 딕셔너리로 반환 (로그 파일은 쓰지 않음)
+  def get_env(self, base=0):
+    return {
+      name: float(value)
+      for name, value in zip(self.names, self.values[base])
+      if not np.isnan(value)
+    }
+
+
+# 실행 부분
+if __name__ == '__main__':
+  bds = BatchDummySensor(10000)
+  start = time.perf_counter()
+  for _ in range(100):
+    bds.set_env()
+  elapsed = time.perf_counter() - start
+  print(f'기지 {bds.base_count}곳 × 100틱: {elapsed:.3f}초 ({bds.base_count * 100 / elapsed:,.0f} 기지·틱/초)')
+  print(bds.get_env(0))
@@ -1,8 +1,94 @@
 # mars_mission_computer.py
 
+import atexit
 import random
+import threading
 import time
 
+# 로그 파일을 한 번만 열어 두고, 기록할 내용을 메모리에 모았다가 한꺼번에 쓰는 클래스
+# 버퍼가 max_buffer 글자를 넘거나 flush_interval초가 지나면 파일에 쓴다.
+# background=True이면 별도 스레드가 주기적으로 쓰므로 write()는 디스크를 기다리지 않는다.
+class LogSink:
+  def __init__(self, path='log_record.log', max_buffer=64 * 1024, flush_interval=1.0, background=False):
+    self.file = open(path, 'a')
+    self.max_buffer = max_buffer
+    self.flush_interval = flush_interval
+    self.buffer = []
+    self.buffer_size = 0
+    self.last_flush = time.monotonic()
+    self.buffer_lock = threading.Lock()  # 버퍼 보호
+    self.file_lock = threading.Lock()    # 파일 쓰기 순서 보호
+    self.closed = False
+
+    self.wakeup = threading.Event()
+    self.flusher = None
+    if background:
+      self.flusher = threading.Thread(target=self._run_flusher, daemon=True)
+      self.flusher.start()
+
+    # 종료 전에 close()를 부르지 않아도 남은 내용이 사라지지 않도록 등록
+    atexit.register(self.close)
+
+  # 기록할 내용을 버퍼에 추가 (조건을 만족하면 파일에 씀)
+  def write(self, text):
+    with self.buffer_lock:
+      if self.closed:
+        raise ValueError('닫힌 LogSink에는 기록할 수 없습니다.')
+      self.buffer.append(text)
+      self.buffer_size += len(text)
+      size_reached = self.buffer_size >= self.max_buffer
+      time_reached = time.monotonic() - self.last_flush >= self.flush_interval
+
+    if self.flusher is None:
+      if size_reached or time_reached:
+        self.flush()
+    elif size_reached:
+      # 백그라운드 스레드를 깨워서 쓰게 함 (버퍼가 한도의 4배를 넘으면 메모리 보호를 위해 직접 씀)
+      self.wakeup.set()
+      if self.buffer_size >= self.max_buffer * 4:
+        self.flush()
+
+  # 버퍼 내용을 파일에 씀
+  def flush(self):
+    # 버퍼를 꺼내는 순서와 파일에 쓰는 순서가 같도록 파일 잠금을 먼저 잡는다.
+    with self.file_lock:
+      with self.buffer_lock:
+        data = ''.join(self.buffer)
+        self.buffer = []
+        self.buffer_size = 0
+        self.last_flush = time.monotonic()
+
+      if data and not self.file.closed:
+        self.file.write(data)
+        self.file.flush()
+
+  # 백그라운드 스레드: flush_interval마다 또는 깨워질 때마다 버퍼를 씀
+  def _run_flusher(self):
+    while not self.closed:
+      self.wakeup.wait(self.flush_interval)
+      self.wakeup.clear()
+      self.flush()
+
+  # 남은 내용을 모두 쓰고 파일을 닫음 (여러 번 불러도 안전)
+  def close(self):
+    with self.buffer_lock:
+      if self.closed:
+        return
+      self.closed = True
+    if self.flusher is not None:
+      self.wakeup.set()
+      self.flusher.join()
+    self.flush()
+    with self.file_lock:
+      self.file.close()
+    atexit.unregister(self.close)
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc):
+    self.close()
+
 # 하나의 센서를 표현하는 클래스
 class Sensor:
   def __init__(self, name, label, unit, min_val, max_val, round_digits):
@@ -28,7 +114,10 @@ class Sensor:
 
 # 여러 개의 센서를 관리하는 클래스
 class DummySensor:
-  def __init__(self):
+  def __init__(self, log_sink=None):
+    # 로그 기록용 LogSink (지정하지 않으면 처음 기록할 때 log_record.log용 LogSink 생성)
+    self.log_sink = log_sink
+
     # 센서 목록 생성(Sensor 객체 6개를 리스트에 저장)
     self.sensors = [
       Sensor('mars_base_internal_temperature', '화성 기지 내부 온도', '°C', 18, 30, 2),
@@ -58,9 +147,10 @@ class DummySensor:
     # 줄바꿈을 사용하여 하나의 문자열로 연결
     log_record = '\n'.join(log_lines) + '\n'
 
-    # 로그 파일에 내용 추가로 기록
-    with open('log_record.log', 'a') as file: 
-      file.write(log_record)
+    # 로그 버퍼에 추가 (파일에는 LogSink가 모아서 기록)
+    if self.log_sink is None:
+      self.log_sink = LogSink()
+    self.log_sink.write(log_record)
 
     # 측정된 센서값만 딕셔너리 형태로 반환(None 값은 제외)
     return {
@@ -75,3 +165,4 @@ if __name__ == '__main__':
   ds.set_env()             # set_env 호출(센서 값 설정)
   result = ds.get_env()    # get_env 호출(센서 값 가져오기 및 로그 저장)
   print(result)            # 결과 출력
+  ds.log_sink.close()      # 남은 로그를 파일에 기록하고 닫기
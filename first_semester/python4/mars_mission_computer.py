@@ -1,5 +1,95 @@
+import asyncio
+import atexit
+import threading
 import time
 
+from poll_scheduler import PollScheduler
+from rolling_stats import SensorAggregator
+from sensor_store import SensorStore
+
+
+# LogSink 클래스
+# log_record.log를 열어 둔 채로 기록 내용을 버퍼에 모아 두었다가
+# 크기(max_buffer 글자) 또는 시간(flush_interval초) 조건이 되면 한 번에 기록한다.
+# background=True이면 기록은 별도 스레드가 맡아 센서 측정 루프가 디스크를 기다리지 않는다.
+class LogSink:
+    def __init__(self, path='log_record.log', max_buffer=64 * 1024, flush_interval=1.0, background=False):
+        self.file = open(path, 'a')
+        self.max_buffer = max_buffer
+        self.flush_interval = flush_interval
+        self.buffer = []
+        self.buffer_size = 0
+        self.last_flush = time.monotonic()
+        self.buffer_lock = threading.Lock()
+        self.file_lock = threading.Lock()
+        self.closed = False
+
+        self.wakeup = threading.Event()
+        self.flusher = None
+        if background:
+            self.flusher = threading.Thread(target=self._run_flusher, daemon=True)
+            self.flusher.start()
+
+        # 프로그램이 끝날 때 버퍼에 남은 내용도 기록
+        atexit.register(self.close)
+
+    def write(self, text):
+        with self.buffer_lock:
+            if self.closed:
+                raise ValueError('닫힌 LogSink에는 기록할 수 없습니다.')
+            self.buffer.append(text)
+            self.buffer_size += len(text)
+            size_reached = self.buffer_size >= self.max_buffer
+            time_reached = time.monotonic() - self.last_flush >= self.flush_interval
+
+        if self.flusher is None:
+            if size_reached or time_reached:
+                self.flush()
+        elif size_reached:
+            self.wakeup.set()
+            # 기록 스레드가 밀려 버퍼가 한도의 4배를 넘으면 직접 기록
+            if self.buffer_size >= self.max_buffer * 4:
+                self.flush()
+
+    def flush(self):
+        # 버퍼를 꺼내는 순서와 파일에 쓰는 순서가 같도록 파일 잠금을 먼저 잡는다.
+        with self.file_lock:
+            with self.buffer_lock:
+                data = ''.join(self.buffer)
+                self.buffer = []
+                self.buffer_size = 0
+                self.last_flush = time.monotonic()
+
+            if data and not self.file.closed:
+                self.file.write(data)
+                self.file.flush()
+
+    def _run_flusher(self):
+        while not self.closed:
+            self.wakeup.wait(self.flush_interval)
+            self.wakeup.clear()
+            self.flush()
+
+    def close(self):
+        with self.buffer_lock:
+            if self.closed:
+                return
+            self.closed = True
+        if self.flusher is not None:
+            self.wakeup.set()
+            self.flusher.join()
+        self.flush()
+        with self.file_lock:
+            self.file.close()
+        atexit.unregister(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
 # Sensor 클래스
 class Sensor:
     def __init__(self, name, label, unit, min_val, max_val, round_digits):
@@ -25,7 +115,8 @@ class Sensor:
 
 # DummySensor 클래스
 class DummySensor:
-    def __init__(self):
+    def __init__(self, log_sink=None):
+        self.log_sink = log_sink
         self.sensors = [
             Sensor('mars_base_internal_temperature', '화성 기지 내부 온도', '°C', 18, 30, 2),
             Sensor('mars_base_external_temperature', '화성 기지 외부 온도', '°C', 0, 21, 2),
@@ -49,8 +140,9 @@ class DummySensor:
             log_lines.append(sensor.to_log())
             env_data[sensor.name] = sensor.value
 
-        with open('log_record.log', 'a') as file:
-            file.write('\n'.join(log_lines) + '\n\n')
+        if self.log_sink is None:
+            self.log_sink = LogSink()
+        self.log_sink.write('\n'.join(log_lines) + '\n\n')
 
         for line in log_lines:
             print(line)
@@ -61,12 +153,15 @@ class DummySensor:
 
 # MissionComputer 클래스
 class MissionComputer:
-    def __init__(self, ds):
+    def __init__(self, ds, sample_interval=5):
         self.ds = ds
         self.env_values = {}
+        # 원본 값을 쌓아 두지 않고 측정할 때마다 누적/시간 창 통계만 갱신
+        self.aggregator = SensorAggregator([sensor.name for sensor in ds.sensors], sample_interval)
 
     def get_sensor_data(self):
         self.env_values = self.ds.get_env()
+        self.aggregator.add(self.env_values)
 
         # JSON 형식 출력
         json_lines = ['{']
@@ -80,18 +175,18 @@ class MissionComputer:
 
         return self.env_values
 
+    # 시간 창('1m', '5m', '1h', 'total')의 센서별 통계 (평균, 표준편차, 최소, 최대, 개수)
+    def get_window_stats(self, window='5m'):
+        return self.aggregator.report(window)
 
-# 평균 출력 함수
-def print_and_log_average(data_list, sensors):
-    average = {}
-    count = len(data_list)
 
-    for data in data_list:
-        for key in data:
-            average[key] = average.get(key, 0) + data[key]
-
-    for key in average:
-        average[key] = round(average[key] / count, 3)
+# 평균 출력 함수
+def print_and_log_average(window_stats, sensors, log_sink):
+    average = {
+        name: round(stats['mean'], 3)
+        for name, stats in window_stats.items()
+        if stats['mean'] is not None
+    }
 
     now = time.strftime('%Y-%m-%d %H:%M:%S')
     print(f'=== {now} 평균 센서 값 ===')
@@ -104,29 +199,38 @@ def print_and_log_average(data_list, sensors):
             print(line)
             log_lines.append(line)
 
-    with open('log_record.log', 'a') as file:
-        file.write('\n'.join(log_lines) + '\n\n')
+    log_sink.write('\n'.join(log_lines) + '\n\n')
     print()
 
 
 # 메인 실행
 if __name__ == '__main__':
-    ds = DummySensor()
+    log_sink = LogSink(background=True)
+    ds = DummySensor(log_sink)
+    # 센서값은 조회용 이진 시계열 저장소에도 기록
+    store = SensorStore('sensor_store', [sensor.name for sensor in ds.sensors])
     RunComputer = MissionComputer(ds)
-    collected = []
+    sample_count = 0
 
-    print('실행 중입니다. 종료하려면 Window는 Ctrl + C / Mac은 Control + C 를 누르세요.\n')
+    # 측정이 끝날 때마다 저장소에 기록하고, 5분마다 (5초 × 60) 최근 5분 평균 출력
+    def record(name, env):
+        global sample_count
+        store.append(env)
+        sample_count += 1
+        if sample_count % 60 == 0:
+            print_and_log_average(RunComputer.get_window_stats('5m'), ds.sensors, log_sink)
 
-    try:
-        while True:
-            env = RunComputer.get_sensor_data()
-            collected.append(env)
+    # 5초 간격 측정은 PollScheduler가 '시작 시각 + n × 5초'에 맞춰 실행하므로 측정 시간만큼 주기가 밀리지 않는다.
+    scheduler = PollScheduler(interval=5, jitter=0, on_result=record)
+    scheduler.add_source('mission_computer', RunComputer.get_sensor_data)
 
-            if len(collected) >= 60:  # 5분치 데이터 (5초 × 60)
-                print_and_log_average(collected, ds.sensors)
-                collected.clear()  # 다시 누적 시작
+    print('실행 중입니다. 종료하려면 Window는 Ctrl + C / Mac은 Control + C 를 누르세요.\n')
 
-            time.sleep(5)  # 5초 간격
+    try:
+        asyncio.run(scheduler.run())
 
     except KeyboardInterrupt:
         print('\nSystem stopped....')
+    finally:
+        store.close()
+        log_sink.close()
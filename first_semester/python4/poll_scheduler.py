@@ -0,0 +1,145 @@
+import asyncio
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+# PollSource 클래스
+# 폴링 대상 하나와 그 통계 (폴링 횟수, 건너뛴 횟수, 오류 횟수, 가장 늦게 시작한 시간)
+class PollSource:
+    __slots__ = ('name', 'poll', 'blocking', 'pending', 'polls', 'skipped', 'errors', 'max_lateness')
+
+    def __init__(self, name, poll, blocking):
+        self.name = name
+        self.poll = poll            # 값을 반환하는 함수 또는 코루틴 함수
+        self.blocking = blocking    # True이면 스레드 풀에서 실행 (오래 걸리는 동기 함수용)
+        self.pending = None         # 아직 끝나지 않은 폴링 작업
+        self.polls = 0
+        self.skipped = 0
+        self.errors = 0
+        self.max_lateness = 0.0
+
+
+# PollScheduler 클래스
+# 여러 센서 소스를 고정 주기로 동시에 폴링하는 asyncio 스케줄러
+# - 다음 실행 시각을 '시작 시각 + n × 주기'로 계산하므로 실행 시간이 쌓여 주기가 밀리지 않는다.
+# - 소스마다 시작 시각을 jitter만큼 무작위로 흩어 한 순간에 몰리지 않게 한다.
+# - 이전 폴링이 끝나지 않았으면 이번 주기는 건너뛰어(backpressure) 느린 소스의 작업이 쌓이지 않는다.
+# - 소스마다 별도 작업으로 돌기 때문에 느린 소스가 다른 소스를 늦추지 않는다.
+# - blocking 소스는 asyncio 기본 스레드 풀(CPU 수 + 4개)을 함께 쓰지 않고, blocking 소스 수만큼 스레드를 가진
+#   전용 풀에서 실행한다. 소스마다 동시에 하나만 실행되므로 느린 소스가 다른 소스의 스레드를 기다리게 하지 않는다.
+class PollScheduler:
+    def __init__(self, interval=1.0, jitter=1.0, on_result=None):
+        self.interval = interval
+        self.jitter = jitter
+        self.on_result = on_result  # on_result(소스 이름, 값) 형태로 호출
+        self.sources = []
+        self.executor = None        # blocking 소스 전용 스레드 풀 (run() 동안만 사용)
+
+    def add_source(self, name, poll, blocking=False):
+        source = PollSource(name, poll, blocking)
+        self.sources.append(source)
+        return source
+
+    async def _poll_once(self, source):
+        try:
+            if source.blocking:
+                value = await asyncio.get_running_loop().run_in_executor(self.executor, source.poll)
+            else:
+                value = source.poll()
+                if asyncio.iscoroutine(value):
+                    value = await value
+            source.polls += 1
+            if self.on_result is not None:
+                self.on_result(source.name, value)
+        except Exception:
+            source.errors += 1
+
+    async def _run_source(self, source, start, stop_at):
+        loop = asyncio.get_running_loop()
+        first = start + random.uniform(0, self.jitter * self.interval)
+        tick = 0
+        deadline = first
+
+        while stop_at is None or deadline < stop_at:
+            delay = deadline - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            now = loop.time()
+            source.max_lateness = max(source.max_lateness, now - deadline)
+
+            if source.pending is not None and not source.pending.done():
+                source.skipped += 1
+            else:
+                source.pending = asyncio.create_task(self._poll_once(source))
+
+            # 루프가 한참 밀렸다면 지나간 주기는 몰아서 실행하지 않고 건너뜀
+            tick += 1
+            missed = int((now - first) // self.interval) + 1 - tick
+            if missed > 0:
+                source.skipped += missed
+                tick += missed
+            deadline = first + tick * self.interval
+
+        if source.pending is not None:
+            await source.pending
+
+    # 모든 소스를 duration초 동안 폴링 (duration이 없으면 취소될 때까지)
+    async def run(self, duration=None):
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        stop_at = start + duration if duration is not None else None
+        blocking_count = sum(source.blocking for source in self.sources)
+        if blocking_count:
+            self.executor = ThreadPoolExecutor(max_workers=blocking_count, thread_name_prefix='poll')
+        try:
+            await asyncio.gather(*(self._run_source(source, start, stop_at) for source in self.sources))
+        finally:
+            if self.executor is not None:
+                self.executor.shutdown(wait=False, cancel_futures=True)
+                self.executor = None
+
+    # 전체 통계 요약
+    def summary(self):
+        return {
+            'sources': len(self.sources),
+            'polls': sum(source.polls for source in self.sources),
+            'skipped': sum(source.skipped for source in self.sources),
+            'errors': sum(source.errors for source in self.sources),
+            'max_lateness': max((source.max_lateness for source in self.sources), default=0.0),
+        }
+
+
+# DummySensor를 화면 출력과 로그 기록 없이 값만 읽는 폴링 함수로 감싸기
+def sensor_source(ds):
+    def poll():
+        ds.set_env()
+        return {sensor.name: sensor.value for sensor in ds.sensors}
+    return poll
+
+
+# 실행 부분: python poll_scheduler.py [소스 수] [실행 시간(초)]
+if __name__ == '__main__':
+    # mars_mission_computer가 이 모듈의 PollScheduler를 사용하므로 실행할 때만 불러옴
+    from mars_mission_computer import DummySensor
+
+    source_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    duration = float(sys.argv[2]) if len(sys.argv) > 2 else 10.0
+
+    scheduler = PollScheduler(interval=1.0)
+    for i in range(source_count):
+        scheduler.add_source(f'base_{i:04d}', sensor_source(DummySensor()))
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    asyncio.run(scheduler.run(duration))
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+
+    result = scheduler.summary()
+    print(f'소스 {result["sources"]}개, {duration:.0f}초 동안 1Hz 폴링')
+    print(f'  폴링 {result["polls"]}회, 건너뜀 {result["skipped"]}회, 오류 {result["errors"]}회')
+    print(f'  최대 지연: {result["max_lateness"] * 1000:.1f}ms')
+    print(f'  CPU 사용률: {cpu / wall * 100:.1f}% (CPU {cpu:.2f}초 / 경과 {wall:.2f}초)')
@@ -0,0 +1,128 @@
+import math
+from collections import deque
+
+
+# RunningStats 클래스
+# 처음부터 지금까지의 개수, 평균, 분산(Welford 방식), 최소/최대를 값 하나당 O(1)로 갱신
+class RunningStats:
+    __slots__ = ('count', 'mean', 'm2', 'min', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    @property
+    def variance(self):
+        return self.m2 / self.count if self.count else 0.0
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'mean': self.mean if self.count else None,
+            'std': math.sqrt(self.variance),
+            'min': self.min,
+            'max': self.max,
+        }
+
+
+# SlidingWindow 클래스
+# 최근 capacity개 값만 고정 크기 링 버퍼에 유지하며 합계/제곱합을 갱신하고,
+# 최소/최대는 단조 큐(monotonic deque)로 관리해서 값 하나당 평균 O(1)로 갱신
+class SlidingWindow:
+    __slots__ = ('capacity', 'values', 'seq', 'total', 'total_sq', 'min_queue', 'max_queue')
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.values = [0.0] * capacity
+        self.seq = 0  # 지금까지 들어온 값의 개수 (다음 값의 순번)
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.min_queue = deque()  # (순번, 값), 값이 증가하는 순
+        self.max_queue = deque()  # (순번, 값), 값이 감소하는 순
+
+    def add(self, value):
+        position = self.seq % self.capacity
+        if self.seq >= self.capacity:
+            old = self.values[position]
+            self.total -= old
+            self.total_sq -= old * old
+        self.values[position] = value
+        self.total += value
+        self.total_sq += value * value
+
+        while self.min_queue and self.min_queue[-1][1] >= value:
+            self.min_queue.pop()
+        self.min_queue.append((self.seq, value))
+        while self.max_queue and self.max_queue[-1][1] <= value:
+            self.max_queue.pop()
+        self.max_queue.append((self.seq, value))
+
+        # 창 밖으로 밀려난 값은 큐 앞에서 제거
+        oldest = self.seq - self.capacity + 1
+        if self.min_queue[0][0] < oldest:
+            self.min_queue.popleft()
+        if self.max_queue[0][0] < oldest:
+            self.max_queue.popleft()
+        self.seq += 1
+
+    @property
+    def count(self):
+        return min(self.seq, self.capacity)
+
+    def summary(self):
+        count = self.count
+        if count == 0:
+            return {'count': 0, 'mean': None, 'std': 0.0, 'min': None, 'max': None}
+        mean = self.total / count
+        variance = max(self.total_sq / count - mean * mean, 0.0)
+        return {
+            'count': count,
+            'mean': mean,
+            'std': math.sqrt(variance),
+            'min': self.min_queue[0][1],
+            'max': self.max_queue[0][1],
+        }
+
+
+# SensorAggregator 클래스
+# 센서마다 전체 누적 통계와 여러 시간 창(기본 1분/5분/1시간)의 통계를 함께 관리
+# 시간 창의 크기는 측정 간격(sample_interval초)으로 나눈 값 개수로 정한다.
+class SensorAggregator:
+    DEFAULT_WINDOWS = {'1m': 60, '5m': 300, '1h': 3600}
+
+    def __init__(self, sensor_names, sample_interval=5, windows=None):
+        windows = windows or self.DEFAULT_WINDOWS
+        self.sensor_names = list(sensor_names)
+        self.total = {name: RunningStats() for name in self.sensor_names}
+        self.windows = {
+            window: {name: SlidingWindow(max(1, seconds // sample_interval)) for name in self.sensor_names}
+            for window, seconds in windows.items()
+        }
+
+    # 측정값 하나(센서 이름 → 값)를 모든 통계에 반영
+    def add(self, env):
+        for name in self.sensor_names:
+            value = env.get(name)
+            if value is None:
+                continue
+            self.total[name].add(value)
+            for sensor_windows in self.windows.values():
+                sensor_windows[name].add(value)
+
+    # 지정한 시간 창(또는 'total')의 센서별 통계 반환
+    def report(self, window='5m'):
+        stats = self.total if window == 'total' else self.windows[window]
+        return {name: stats[name].summary() for name in self.sensor_names}
@@ -0,0 +1,173 @@
+import json
+import os
+import time
+
+import numpy as np
+
+
+# SensorStore 클래스
+# 센서값을 텍스트 대신 컬럼별 이진 배열로 계속 추가 저장하는 시계열 저장소
+#
+# sensor_store/
+#   meta.json                  센서 이름 목록, 세그먼트 크기
+#   segment_000000/
+#     timestamp.i64            측정 시각 (Unix 시간, 밀리초)
+#     <센서 이름>.f32           센서별 측정값
+#   segment_000001/ ...
+#
+# 세그먼트는 segment_size개(기본 86400개 = 1Hz 기준 하루)를 담는 고정 크기 파일이고,
+# np.memmap으로 열어 필요한 구간만 디스크에서 읽는다. 시각이 0인 칸은 아직 비어 있는 칸이다.
+class SensorStore:
+    def __init__(self, path, sensor_names=None, segment_size=86400):
+        self.path = path
+        meta_path = os.path.join(path, 'meta.json')
+
+        if os.path.exists(meta_path):
+            with open(meta_path, 'r', encoding='utf-8') as file:
+                meta = json.load(file)
+            if sensor_names is not None and list(sensor_names) != meta['sensors']:
+                raise ValueError('저장소의 센서 목록이 다릅니다.')
+        else:
+            if sensor_names is None:
+                raise ValueError('새 저장소에는 센서 목록이 필요합니다.')
+            meta = {'sensors': list(sensor_names), 'segment_size': segment_size}
+            os.makedirs(path, exist_ok=True)
+            with open(meta_path, 'w', encoding='utf-8') as file:
+                json.dump(meta, file, ensure_ascii=False)
+
+        self.sensor_names = meta['sensors']
+        self.segment_size = meta['segment_size']
+        self.segment_count = len(self._segment_dirs())
+
+        # 쓰기용으로 열어 둔 마지막 세그먼트
+        self._writing = None
+        self._writing_index = None
+        self._writing_count = 0
+
+    def _segment_dirs(self):
+        return sorted(
+            name for name in os.listdir(self.path)
+            if name.startswith('segment_') and os.path.isdir(os.path.join(self.path, name))
+        )
+
+    def _segment_path(self, index):
+        return os.path.join(self.path, f'segment_{index:06d}')
+
+    # 세그먼트의 시각 배열과 센서별 배열을 memmap으로 열기
+    def _open_segment(self, index, mode):
+        segment_path = self._segment_path(index)
+        shape = (self.segment_size,)
+        timestamps = np.memmap(os.path.join(segment_path, 'timestamp.i64'), dtype=np.int64, mode=mode, shape=shape)
+        columns = {
+            name: np.memmap(os.path.join(segment_path, f'{name}.f32'), dtype=np.float32, mode=mode, shape=shape)
+            for name in self.sensor_names
+        }
+        return timestamps, columns
+
+    # 세그먼트에 실제로 기록된 개수 (비어 있는 칸은 시각이 0)
+    @staticmethod
+    def _filled(timestamps):
+        empty = np.flatnonzero(timestamps == 0)
+        return int(empty[0]) if len(empty) else len(timestamps)
+
+    # 새 세그먼트 파일 생성 (0으로 채워진 고정 크기 파일)
+    def _create_segment(self, index):
+        os.makedirs(self._segment_path(index))
+        self.segment_count = index + 1
+        return self._open_segment(index, 'w+')
+
+    # 측정값 하나 추가 (values는 센서 이름 → 값, timestamp_ms가 없으면 현재 시각)
+    def append(self, values, timestamp_ms=None):
+        if timestamp_ms is None:
+            timestamp_ms = time.time_ns() // 1_000_000
+
+        if self._writing is None:
+            if self.segment_count:
+                self._writing_index = self.segment_count - 1
+                self._writing = self._open_segment(self._writing_index, 'r+')
+                self._writing_count = self._filled(self._writing[0])
+            else:
+                self._writing_index = 0
+                self._writing = self._create_segment(0)
+                self._writing_count = 0
+
+        if self._writing_count >= self.segment_size:
+            self.flush()
+            self._writing_index += 1
+            self._writing = self._create_segment(self._writing_index)
+            self._writing_count = 0
+
+        timestamps, columns = self._writing
+        position = self._writing_count
+        for name in self.sensor_names:
+            columns[name][position] = values.get(name, np.nan)
+        # 시각은 마지막에 기록해야 중간에 종료되어도 반쯤 쓴 칸이 기록된 것으로 보이지 않음
+        timestamps[position] = timestamp_ms
+        self._writing_count += 1
+
+    # 기록한 내용을 디스크에 반영
+    def flush(self):
+        if self._writing is not None:
+            timestamps, columns = self._writing
+            for column in columns.values():
+                column.flush()
+            timestamps.flush()
+
+    def close(self):
+        self.flush()
+        self._writing = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # start_ms 이상 end_ms 미만 구간의 (시각 배열, 센서 이름 → 값 배열) 반환
+    def query(self, start_ms, end_ms, sensors=None):
+        sensors = sensors or self.sensor_names
+        timestamp_parts = []
+        column_parts = {name: [] for name in sensors}
+
+        for index in range(self.segment_count):
+            timestamps, columns = self._open_segment(index, 'r')
+            count = self._filled(timestamps)
+            if count == 0 or timestamps[0] >= end_ms or timestamps[count - 1] < start_ms:
+                continue
+
+            # 세그먼트 안은 시간순이므로 이진 탐색으로 구간 경계를 찾음
+            filled = timestamps[:count]
+            begin = int(np.searchsorted(filled, start_ms, side='left'))
+            end = int(np.searchsorted(filled, end_ms, side='left'))
+            timestamp_parts.append(np.array(filled[begin:end]))
+            for name in sensors:
+                column_parts[name].append(np.array(columns[name][begin:end]))
+
+        if not timestamp_parts:
+            return np.empty(0, dtype=np.int64), {name: np.empty(0, dtype=np.float32) for name in sensors}
+        return (
+            np.concatenate(timestamp_parts),
+            {name: np.concatenate(parts) for name, parts in column_parts.items()},
+        )
+
+    # 구간을 bucket_ms 단위로 나누어 평균낸 (구간 시작 시각 배열, 센서 이름 → 평균 배열) 반환
+    # 측정되지 않은 값(NaN)은 평균에서 빼고, 구간의 값이 모두 NaN이면 그 구간의 평균은 NaN이다.
+    def downsample(self, start_ms, end_ms, bucket_ms, sensors=None):
+        timestamps, columns = self.query(start_ms, end_ms, sensors)
+        if len(timestamps) == 0:
+            return timestamps, columns
+
+        buckets = timestamps // bucket_ms
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        averages = {name: self._bucket_means(values, starts) for name, values in columns.items()}
+        return buckets[starts] * bucket_ms, averages
+
+    # starts 위치에서 시작하는 구간별로 NaN을 뺀 평균 계산
+    @staticmethod
+    def _bucket_means(values, starts):
+        valid = ~np.isnan(values)
+        sums = np.add.reduceat(np.where(valid, values, 0).astype(np.float64), starts)
+        counts = np.add.reduceat(valid.astype(np.int64), starts)
+        means = np.full(len(starts), np.nan)
+        np.divide(sums, counts, out=means, where=counts > 0)
+        return means.astype(np.float32)
@@ -1,214 +1,252 @@
 # 시스템 정보 획득은 허용되므로 platform과 os는 import 유지
+import importlib.util
+import json
 import platform
 import os
+import sys
+import threading
+import time
+
+from metrics_backend import get_backend
+from mission_settings import SettingsFile
+
+
+class MetricsSampler:
+    """
+    백그라운드 스레드에서 collect()를 주기적으로 호출하여 최신 측정값(스냅샷)을 보관한다.
+    스냅샷은 (값 딕셔너리, JSON 문자열) 튜플을 통째로 교체하는 방식으로 갱신하므로
+    읽는 쪽은 잠금 없이 self.snapshot만 읽으면 항상 완성된 값을 얻는다.
+    listeners에 등록한 함수는 새로 측정할 때마다 측정 스레드에서 값 딕셔너리를 받아 호출된다.
+    사용률은 직전 측정과의 차이로 계산하므로 첫 측정은 시작 후 한 주기(interval)가 지난 뒤에 하고,
+    그 전까지 스냅샷은 빈 값이다. 첫 측정을 기다리려면 ready.wait()를 사용한다.
+    """
+
+    def __init__(self, collect, interval=1.0):
+        self.collect = collect
+        self.interval = interval
+        self.snapshot = ({}, '{}')
+        self.listeners = []
+        self.ready = threading.Event()  # 첫 측정이 끝나면 설정됨
+        self._stop = threading.Event()
+        self._thread = None
+
+    def sample_now(self):
+        values = self.collect()
+        self.snapshot = (values, json.dumps(values, indent=2, ensure_ascii=False))
+        for listener in self.listeners:
+            listener(values)
+        self.ready.set()
+        return self.snapshot
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.sample_now()
+            except Exception:
+                pass  # 측정 실패 시 이전 스냅샷 유지
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
 
 
 class MissionComputer:
-    def __init__(self):
-        # 출력 항목 기본 설정값: 모두 True로 설정
-        self.settings = {
-            'os': True,
-            'os_version': True,
-            'cpu_type': True,
-            'cpu_cores': True,
-            'memory_total': True,
-            'cpu_usage': True,
-            'memory_usage': True
-        }
-        # 설정 파일을 불러와 사용자 설정값 반영
-        self.load_settings()
+    def __init__(self, sample_interval=1.0, backend=None, settings_path='setting.txt'):
+        # 설정 파일을 불러와 사용자 설정값 반영 (파일이 없으면 모든 항목 True)
+        self.settings_file = SettingsFile(settings_path)
+
+        # 운영체제별 측정 방법 (기본: 현재 운영체제용 backend, Linux는 외부 명령어 없이 /proc만 사용)
+        self.backend = backend or get_backend()
+
+        # 켜진 항목의 측정 함수 목록과 시스템 정보를 설정에 맞춰 미리 만들어 둠
+        self.apply_settings()
 
-    def load_settings(self):
+        # 사용률처럼 바뀌는 값은 백그라운드 스레드가 주기적으로 측정
+        self.sampler = MetricsSampler(self.collect_load, sample_interval)
+        self.sampler.start()
+
+        # Prometheus 형식 HTTP 내보내기는 start_exporter()를 호출했을 때만 사용
+        self.exporter = None
+
+    @property
+    def settings(self):
+        return self.settings_file.settings
+
+    def apply_settings(self):
         """
-        setting.txt 파일에서 항목별 출력 여부(True/False)를 읽어 self.settings에 반영한다.
-        파일이 없으면 기본값(True) 유지.
+        현재 설정에서 켜진 항목만 골라 측정 함수 목록을 만든다.
+        측정할 때는 항목마다 설정을 확인하지 않고 이 목록만 차례로 호출한다.
+        실행 중에는 바뀌지 않는 시스템 정보도 여기서 한 번만 수집하고 JSON 문자열을 만들어 둔다.
         """
-        try:
-            f = open('setting.txt', 'r')        # 설정 파일 열기
-            lines = f.readlines()               # 모든 줄 읽기
-            f.close()
-            for line in lines:
-                parts = line.strip().split('=')  # 'key=value' 형태로 분리
-                if len(parts) == 2:
-                    key = parts[0].strip()
-                    value = parts[1].strip().lower()
-                    self.settings[key] = (value == 'true')  # True 또는 False로 설정
-        except:
-            pass  # 설정 파일이 없거나 오류가 있어도 무시
+        enabled = self.settings.enabled
+        info_collectors = {
+            'os': self.collect_os,
+            'os_version': self.collect_os_version,
+            'cpu_type': self.collect_cpu_type,
+            'cpu_cores': self.collect_cpu_cores,
+            'memory_total': self.collect_memory_total,
+        }
+        load_collectors = {
+            'cpu_usage': self.collect_cpu_usage,
+            'memory_usage': self.collect_memory_usage,
+        }
+        self.info_collectors = [info_collectors[key] for key in enabled if key in info_collectors]
+        self.load_collectors = [load_collectors[key] for key in enabled if key in load_collectors]
 
-    def get_mission_computer_info(self):
+        # 정보 딕셔너리와 JSON 문자열은 한 번에 교체
+        info = self.collect_info()
+        self.info_snapshot = (info, json.dumps(info, indent=2, ensure_ascii=False))
+
+    @property
+    def info(self):
+        return self.info_snapshot[0]
+
+    def reload_settings(self):
         """
-        운영체제, CPU 정보, 메모리 총량 등 시스템 기본 정보를 수집하여 출력한다.
-        출력은 JSON과 유사한 문자열 포맷으로 직접 구성.
+        setting.txt가 바뀌었으면 다시 읽어 적용하고 True를 반환한다.
+        MetricsSampler가 측정할 때마다 호출하므로 재시작 없이 설정 변경이 반영된다.
         """
-        info = '{\n'  # 출력 시작
+        if self.settings_file.reload_if_changed():
+            self.apply_settings()
+            return True
+        return False
 
-        # 운영체제 이름 (예: Windows, Linux, Darwin)
-        if self.settings.get('os'):
-            info += f'  "os": "{platform.system()}",\n'
+    # 운영체제 이름 (예: Windows, Linux, Darwin)
+    def collect_os(self, info):
+        info['os'] = platform.system()
 
-        # 운영체제 버전 정보
-        if self.settings.get('os_version'):
-            info += f'  "os_version": "{platform.version()}",\n'
+    # 운영체제 버전 정보
+    def collect_os_version(self, info):
+        info['os_version'] = platform.version()
 
-        # CPU 종류 (Intel, arm64 등)
-        if self.settings.get('cpu_type'):
-            info += f'  "cpu_type": "{platform.processor()}",\n'
+    # CPU 종류 (Intel, arm64 등)
+    def collect_cpu_type(self, info):
+        info['cpu_type'] = self.backend.cpu_type()
 
-        # CPU 코어 개수
-        if self.settings.get('cpu_cores'):
-            info += f'  "cpu_cores": {os.cpu_count()},\n'
+    # CPU 코어 개수
+    def collect_cpu_cores(self, info):
+        info['cpu_cores'] = os.cpu_count()
 
-        # 메모리 총량 (Byte 단위)
-        if self.settings.get('memory_total'):
-            try:
-                os_type = platform.system()
-                mem_total = 0
-
-                if os_type == 'Windows':
-                    # Windows에서는 ctypes 사용하여 시스템 API로 메모리 정보 획득
-                    import ctypes
-
-                    class MEMORYSTATUS(ctypes.Structure):
-                        _fields_ = [
-                            ('dwLength', ctypes.c_uint),
-                            ('dwMemoryLoad', ctypes.c_uint),
-                            ('dwTotalPhys', ctypes.c_size_t),
-                            ('dwAvailPhys', ctypes.c_size_t),
-                            ('dwTotalPageFile', ctypes.c_size_t),
-                            ('dwAvailPageFile', ctypes.c_size_t),
-                            ('dwTotalVirtual', ctypes.c_size_t),
-                            ('dwAvailVirtual', ctypes.c_size_t),
-                        ]
-
-                    memory = MEMORYSTATUS()
-                    memory.dwLength = ctypes.sizeof(MEMORYSTATUS)
-                    ctypes.windll.kernel32.GlobalMemoryStatus(ctypes.byref(memory))
-                    mem_total = memory.dwTotalPhys
-
-                elif os_type == 'Linux':
-                    # /proc/meminfo 파일에서 MemTotal 읽기
-                    f = open('/proc/meminfo', 'r')
-                    for line in f:
-                        if 'MemTotal' in line:
-                            mem_total = int(line.split()[1]) * 1024  # KB → Byte
-                            break
-                    f.close()
-
-                elif os_type == 'Darwin':
-                    # macOS는 sysctl 명령어로 메모리 크기 획득
-                    mem_total = int(os.popen("sysctl -n hw.memsize").read())
-
-                info += f'  "memory_total": {mem_total},\n'
-
-            except:
-                info += '  "memory_total": "ERROR",\n'
-
-        # 마지막 쉼표 제거 후 닫기
-        if info.endswith(',\n'):
-            info = info[:-2] + '\n'
-        info += '}\n'
-        print(info)
+    # 메모리 총량 (Byte 단위)
+    def collect_memory_total(self, info):
+        try:
+            info['memory_total'] = self.backend.memory_total()
+        except Exception:
+            info['memory_total'] = 'ERROR'
+
+    def collect_info(self):
+        """
+        운영체제, CPU 정보, 메모리 총량 등 시스템 기본 정보 중 켜진 항목을 딕셔너리로 수집한다.
+        """
+        info = {}
+        for collect in self.info_collectors:
+            collect(info)
+        return info
+
+    def get_mission_computer_info(self):
+        """
+        미리 수집해 둔 시스템 기본 정보를 JSON 형식으로 출력한다.
+        """
+        info, info_json = self.info_snapshot
+        print(info_json + '\n')
+        return info
+
+    # CPU 사용률 측정 (전체, 코어별, 이 프로세스)
+    def collect_cpu_usage(self, load):
+        try:
+            usage = self.backend.cpu_usage()
+            if usage is not None:
+                total, cores, process = usage
+                load['cpu_usage'] = f'{total:.2f}%'
+                if cores:
+                    load['cpu_usage_per_core'] = {name: f'{value:.2f}%' for name, value in cores.items()}
+                if process is not None:
+                    load['process_cpu_usage'] = f'{process:.2f}%'
+        except Exception:
+            load['cpu_usage'] = 'ERROR'
+
+    # 메모리 사용률 측정
+    def collect_memory_usage(self, load):
+        try:
+            load['memory_usage'] = f'{self.backend.memory_usage():.2f}%'
+        except Exception:
+            load['memory_usage'] = 'ERROR'
+
+    def collect_load(self):
+        """
+        실시간 CPU 및 메모리 사용률을 backend로 측정하여 딕셔너리로 반환한다.
+        MetricsSampler의 백그라운드 스레드에서 주기적으로 호출되며, 설정 파일이 바뀌었으면 먼저 다시 읽는다.
+        """
+        self.reload_settings()
+        load = {}
+        for collect in self.load_collectors:
+            collect(load)
+        return load
 
     def get_mission_computer_load(self):
         """
-        실시간 CPU 및 메모리 사용률을 측정하여 출력한다.
-        Linux의 CPU 사용률은 time.sleep()이 필요하여 이 버전에서는 제외함.
+        백그라운드 스레드가 측정해 둔 최신 CPU 및 메모리 사용률을 JSON 형식으로 출력한다.
+        호출할 때마다 파일을 읽거나 명령어를 실행하지 않는다.
+        시작 직후라 아직 측정값이 없으면 첫 측정(한 주기)이 끝날 때까지 기다린다.
         """
-        os_type = platform.system()
-        load = '{\n'  # 출력 시작
+        self.sampler.ready.wait(self.sampler.interval * 2)
+        load, load_json = self.sampler.snapshot
+        print(load_json + '\n')
+        return load
 
-        # CPU 사용률 측정
-        if self.settings.get('cpu_usage'):
-            try:
-                cpu_usage = None
-
-                if os_type == 'Windows':
-                    # Windows: wmic 명령어로 CPU 부하 조회
-                    output = os.popen('wmic cpu get loadpercentage').read().splitlines()
-                    for line in output:
-                        if line.strip().isdigit():
-                            cpu_usage = line.strip() + '%'
-                            break
-
-                elif os_type == 'Darwin':
-                    # macOS: 모든 프로세스의 %CPU 합산
-                    usage = os.popen("ps -A -o %cpu | awk '{s+=$1} END {print s}'").read().strip()
-                    cpu_usage = f'{float(usage):.2f}%'
-
-                # Linux는 time 모듈 제거되어 측정 불가
-
-                if cpu_usage:
-                    load += f'  "cpu_usage": "{cpu_usage}",\n'
-            except:
-                load += '  "cpu_usage": "ERROR",\n'
-
-        # 메모리 사용률 측정
-        if self.settings.get('memory_usage'):
-            try:
-                mem_usage = None
-
-                if os_type == 'Windows':
-                    # Windows: ctypes 사용
-                    import ctypes
-
-                    class MEMORYSTATUS(ctypes.Structure):
-                        _fields_ = [
-                            ('dwLength', ctypes.c_uint),
-                            ('dwMemoryLoad', ctypes.c_uint),
-                            ('dwTotalPhys', ctypes.c_size_t),
-                            ('dwAvailPhys', ctypes.c_size_t),
-                            ('dwTotalPageFile', ctypes.c_size_t),
-                            ('dwAvailPageFile', ctypes.c_size_t),
-                            ('dwTotalVirtual', ctypes.c_size_t),
-                            ('dwAvailVirtual', ctypes.c_size_t),
-                        ]
-
-                    memory = MEMORYSTATUS()
-                    memory.dwLength = ctypes.sizeof(MEMORYSTATUS)
-                    ctypes.windll.kernel32.GlobalMemoryStatus(ctypes.byref(memory))
-                    mem_usage = f'{memory.dwMemoryLoad}%'
-
-                elif os_type == 'Linux':
-                    # /proc/meminfo에서 MemTotal, MemAvailable 읽어서 계산
-                    total = available = 0
-                    f = open('/proc/meminfo', 'r')
-                    for line in f:
-                        if 'MemTotal' in line:
-                            total = int(line.split()[1])
-                        elif 'MemAvailable' in line:
-                            available = int(line.split()[1])
-                        if total and available:
-                            break
-                    f.close()
-                    mem_usage = f'{(100 * (1 - available / total)):.2f}%'
-
-                elif os_type == 'Darwin':
-                    # macOS: vm_stat 명령어로 free page 수 계산
-                    mem_total = int(os.popen("sysctl -n hw.memsize").read())
-                    stats = os.popen("vm_stat").read()
-                    free_pages = 0
-                    for line in stats.splitlines():
-                        if 'Pages free' in line:
-                            free_pages = int(line.split(":")[1].strip().replace('.', ''))
-                            break
-                    free_bytes = free_pages * 4096
-                    mem_usage = f'{(100 * (1 - free_bytes / mem_total)):.2f}%'
-
-                if mem_usage:
-                    load += f'  "memory_usage": "{mem_usage}",\n'
-            except:
-                load += '  "memory_usage": "ERROR",\n'
-
-        # 마지막 쉼표 제거 후 닫기
-        if load.endswith(',\n'):
-            load = load[:-2] + '\n'
-        load += '}\n'
-        print(load)
+    def start_exporter(self, port=9100, host='0.0.0.0', sensor_source=None):
+        """
+        측정값을 Prometheus 텍스트 형식으로 제공하는 HTTP 서버(/metrics)를 백그라운드에서 시작한다.
+        sensor_source로 DummySensor를 넘기면 센서값도 함께 내보낸다.
+        """
+        if self.exporter is None:
+            from metrics_exporter import MetricsExporter
+            self.exporter = MetricsExporter(self, sensor_source, host, port)
+            self.exporter.start()
+        return self.exporter
+
+    def stop(self):
+        """
+        백그라운드 측정과 HTTP 서버를 종료한다.
+        """
+        if self.exporter is not None:
+            self.exporter.stop()
+            self.exporter = None
+        self.sampler.stop()
 
 
 # 프로그램 진입점
+# python mars_mission_computer.py --export [포트] 로 실행하면 Ctrl+C를 누를 때까지 /metrics를 제공
 if __name__ == '__main__':
     runComputer = MissionComputer()              # 인스턴스 생성
     runComputer.get_mission_computer_info()      # 시스템 기본 정보 출력
     runComputer.get_mission_computer_load()      # 실시간 부하 정보 출력
+
+    if len(sys.argv) > 1 and sys.argv[1] == '--export':
+        port = int(sys.argv[2]) if len(sys.argv) > 2 else 9100
+        # 센서값은 python3의 DummySensor 사용 (외부 라이브러리 없이 동작)
+        # 이 파일과 모듈 이름이 같으므로 경로를 지정해 다른 이름으로 불러옴
+        sensor_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'python3', 'mars_mission_computer.py')
+        spec = importlib.util.spec_from_file_location('python3_sensor', sensor_path)
+        sensor_module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(sensor_module)
+        sensors = sensor_module.DummySensor()
+        sensors.set_env()
+        runComputer.start_exporter(port, sensor_source=sensors)
+        print(f'http://localhost:{port}/metrics 에서 측정값을 제공합니다. (종료: Ctrl+C)')
+        try:
+            # 센서값은 이 (메인) 스레드에서 갱신하고, exporter는 마지막 값만 읽음
+            while True:
+                time.sleep(runComputer.sampler.interval)
+                sensors.set_env()
+        except KeyboardInterrupt:
+            pass
+
+    runComputer.stop()                           # 백그라운드 측정 종료
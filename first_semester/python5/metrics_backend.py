@@ -0,0 +1,227 @@
+# 운영체제별 시스템 측정 방법을 backend 클래스로 나누어 둔 모듈
+# MissionComputer는 get_backend()로 현재 운영체제에 맞는 backend를 받아 사용한다.
+import os
+import platform
+
+
+class MetricsBackend:
+    """
+    측정 backend의 공통 형식.
+    memory_total()은 Byte 단위 정수, memory_usage()는 % 값,
+    cpu_usage()는 (전체 %, 코어별 % 딕셔너리, 프로세스 %) 또는 측정할 수 없으면 None을 반환한다.
+    """
+
+    name = 'unknown'
+
+    def cpu_type(self):
+        return platform.processor()
+
+    def memory_total(self):
+        raise NotImplementedError
+
+    def memory_usage(self):
+        raise NotImplementedError
+
+    def cpu_usage(self):
+        return None
+
+
+class LinuxCpuSampler:
+    """
+    /proc/stat의 누적 CPU 시간(jiffies)을 이전 측정값과 비교하여 CPU 사용률을 계산한다.
+    전체/코어별 사용률과 이 프로세스(/proc/self/stat)의 CPU 사용률을 함께 구한다.
+    sample()은 파일을 읽고 차이만 계산하므로 기다리지 않고 바로 반환된다.
+    생성할 때 첫 측정값을 읽어 두므로 sample()은 항상 직전 호출(또는 생성) 이후의 값이다.
+    생성 직후 바로 호출하면 지난 시간이 거의 없으므로 측정 간격을 두고 호출해야 의미 있는 값이 나온다.
+    """
+
+    def __init__(self):
+        self.clock_ticks = os.sysconf('SC_CLK_TCK')
+        self.prev_cpu = self._read_proc_stat()  # 'cpu', 'cpu0', ... → (busy, total)
+        self.prev_process = (self._read_process_ticks(), self._read_uptime())
+
+    @staticmethod
+    def _read_proc_stat():
+        times = {}
+        with open('/proc/stat', 'r') as f:
+            for line in f:
+                if not line.startswith('cpu'):
+                    break
+                parts = line.split()
+                # user nice system idle iowait irq softirq steal (guest는 user에 이미 포함)
+                values = [int(v) for v in parts[1:9]]
+                idle = values[3] + values[4]
+                total = sum(values)
+                times[parts[0]] = (total - idle, total)
+        return times
+
+    @staticmethod
+    def _read_self_stat():
+        # 프로세스 이름에 공백이 있을 수 있으므로 마지막 ')' 이후부터 나눔 (필드 3번부터)
+        with open('/proc/self/stat', 'r') as f:
+            data = f.read()
+        return data[data.rindex(')') + 2:].split()
+
+    @classmethod
+    def _read_process_ticks(cls):
+        fields = cls._read_self_stat()
+        return int(fields[11]) + int(fields[12])  # utime + stime
+
+    @staticmethod
+    def _read_uptime():
+        with open('/proc/uptime', 'r') as f:
+            return float(f.read().split()[0])
+
+    def sample(self):
+        """
+        (전체 사용률, 코어별 사용률 딕셔너리, 프로세스 사용률)을 % 단위로 반환한다.
+        """
+        current = self._read_proc_stat()
+        usage = {}
+        for name, (busy, total) in current.items():
+            prev_busy, prev_total = self.prev_cpu.get(name, (0, 0))
+            elapsed = total - prev_total
+            usage[name] = 100 * (busy - prev_busy) / elapsed if elapsed > 0 else 0.0
+        self.prev_cpu = current
+
+        process_ticks = self._read_process_ticks()
+        uptime = self._read_uptime()
+        prev_ticks, prev_uptime = self.prev_process
+        wall = uptime - prev_uptime
+        process_usage = 100 * (process_ticks - prev_ticks) / self.clock_ticks / wall if wall > 0 else 0.0
+        self.prev_process = (process_ticks, uptime)
+
+        cores = {name: value for name, value in usage.items() if name != 'cpu'}
+        return usage.get('cpu', 0.0), cores, process_usage
+
+
+class LinuxBackend(MetricsBackend):
+    """
+    /proc 파일과 os.sysconf만 사용하는 Linux backend (외부 명령어를 실행하지 않음).
+    """
+
+    name = 'linux'
+
+    def __init__(self):
+        self.cpu_sampler = LinuxCpuSampler()
+
+    def cpu_type(self):
+        # platform.processor()는 Linux에서 uname 명령어를 실행하므로 /proc/cpuinfo에서 읽음
+        try:
+            with open('/proc/cpuinfo', 'r') as f:
+                for line in f:
+                    if line.startswith('model name'):
+                        return line.split(':', 1)[1].strip()
+        except OSError:
+            pass
+        return platform.machine()
+
+    def memory_total(self):
+        # 물리 메모리 페이지 수 × 페이지 크기
+        return os.sysconf('SC_PHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+
+    def memory_usage(self):
+        # MemAvailable은 sysconf로 얻을 수 없으므로 /proc/meminfo에서 읽음
+        total = available = 0
+        with open('/proc/meminfo', 'r') as f:
+            for line in f:
+                if line.startswith('MemTotal:'):
+                    total = int(line.split()[1])
+                elif line.startswith('MemAvailable:'):
+                    available = int(line.split()[1])
+                if total and available:
+                    break
+        return 100 * (1 - available / total)
+
+    def cpu_usage(self):
+        return self.cpu_sampler.sample()
+
+
+class DarwinBackend(MetricsBackend):
+    """
+    macOS backend. 시스템 API 대신 sysctl, vm_stat, ps 명령어를 실행하므로 호출 비용이 크다.
+    변하지 않는 메모리 총량은 처음 한 번만 조회한다.
+    """
+
+    name = 'darwin'
+
+    def __init__(self):
+        self._memory_total = None
+
+    def memory_total(self):
+        if self._memory_total is None:
+            self._memory_total = int(os.popen('sysctl -n hw.memsize').read())
+        return self._memory_total
+
+    def memory_usage(self):
+        # vm_stat 명령어로 free page 수 계산
+        stats = os.popen('vm_stat').read()
+        free_pages = 0
+        for line in stats.splitlines():
+            if 'Pages free' in line:
+                free_pages = int(line.split(':')[1].strip().replace('.', ''))
+                break
+        return 100 * (1 - free_pages * 4096 / self.memory_total())
+
+    def cpu_usage(self):
+        # 모든 프로세스의 %CPU 합산
+        usage = os.popen("ps -A -o %cpu | awk '{s+=$1} END {print s}'").read().strip()
+        return float(usage), {}, None
+
+
+class WindowsBackend(MetricsBackend):
+    """
+    Windows backend. 메모리는 ctypes로 시스템 API를 호출하고, CPU 부하는 wmic 명령어로 조회한다.
+    """
+
+    name = 'windows'
+
+    def _memory_status(self):
+        import ctypes
+
+        class MEMORYSTATUS(ctypes.Structure):
+            _fields_ = [
+                ('dwLength', ctypes.c_uint),
+                ('dwMemoryLoad', ctypes.c_uint),
+                ('dwTotalPhys', ctypes.c_size_t),
+                ('dwAvailPhys', ctypes.c_size_t),
+                ('dwTotalPageFile', ctypes.c_size_t),
+                ('dwAvailPageFile', ctypes.c_size_t),
+                ('dwTotalVirtual', ctypes.c_size_t),
+                ('dwAvailVirtual', ctypes.c_size_t),
+            ]
+
+        memory = MEMORYSTATUS()
+        memory.dwLength = ctypes.sizeof(MEMORYSTATUS)
+        ctypes.windll.kernel32.GlobalMemoryStatus(ctypes.byref(memory))
+        return memory
+
+    def memory_total(self):
+        return self._memory_status().dwTotalPhys
+
+    def memory_usage(self):
+        return float(self._memory_status().dwMemoryLoad)
+
+    def cpu_usage(self):
+        output = os.popen('wmic cpu get loadpercentage').read().splitlines()
+        for line in output:
+            if line.strip().isdigit():
+                return float(line.strip()), {}, None
+        return None
+
+
+BACKENDS = {
+    'Linux': LinuxBackend,
+    'Darwin': DarwinBackend,
+    'Windows': WindowsBackend,
+}
+
+
+def get_backend(os_type=None):
+    """
+    운영체제 이름(platform.system() 값)에 맞는 backend를 생성한다. 기본은 현재 운영체제.
+    지원하지 않는 운영체제면 공통 backend(MetricsBackend)를 반환하므로,
+    CPU 사용률은 빠지고 메모리 값은 'ERROR'로 표시된다.
+    """
+    os_type = os_type or platform.system()
+    return BACKENDS.get(os_type, MetricsBackend)()
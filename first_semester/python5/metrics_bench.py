@@ -0,0 +1,53 @@
+# 측정 방법별 초당 호출 횟수 비교
+# 1) 외부 명령어 실행 (기존 macOS 방식의 ps | awk, 호출마다 프로세스 생성)
+# 2) Linux backend 직접 호출 (/proc 파일만 읽음)
+# 3) MissionComputer가 백그라운드에서 측정해 둔 스냅샷 읽기
+import os
+import time
+
+from mars_mission_computer import MissionComputer
+from metrics_backend import LinuxBackend
+
+
+def calls_per_second(func, duration=1.0):
+    """
+    duration초 동안 func를 반복 호출하여 초당 호출 횟수를 반환한다.
+    """
+    count = 0
+    start = time.perf_counter()
+    end = start + duration
+    while time.perf_counter() < end:
+        func()
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+def subprocess_load():
+    usage = os.popen("ps -A -o %cpu | awk '{s+=$1} END {print s}'").read().strip()
+    memory = os.popen('cat /proc/meminfo').read()
+    return usage, memory
+
+
+if __name__ == '__main__':
+    computer = MissionComputer(backend=LinuxBackend())
+
+    # 측정 스레드가 사용하는 backend의 이전 측정값을 바꾸지 않도록 직접 호출용 backend는 따로 만듦
+    backend = LinuxBackend()
+
+    def direct_load():
+        backend.cpu_usage()
+        backend.memory_usage()
+
+    def snapshot_load():
+        return computer.sampler.snapshot
+
+    results = [
+        ('외부 명령어 실행 (ps, cat)', calls_per_second(subprocess_load)),
+        ('Linux backend (/proc 직접)', calls_per_second(direct_load)),
+        ('캐시된 스냅샷', calls_per_second(snapshot_load)),
+    ]
+    computer.sampler.stop()
+
+    baseline = results[0][1]
+    for name, rate in results:
+        print(f'{name:<28} {rate:>14,.0f}회/초  ({rate / baseline:,.0f}배)')
@@ -0,0 +1,169 @@
+# MissionComputer의 측정값을 Prometheus 텍스트 형식으로 내보내는 HTTP 서버
+# 측정값이 바뀔 때(MetricsSampler 주기)마다 응답 본문을 bytes로 미리 만들어 두고,
+# 요청이 오면 만들어 둔 bytes를 그대로 보내므로 수집(scrape) 요청 처리 비용이 거의 없다.
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def escape_label(value):
+    """
+    Prometheus 라벨 값에 들어갈 수 없는 문자(\\, ", 줄바꿈)를 이스케이프한다.
+    """
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def percent_value(text):
+    """
+    '12.34%' 형식의 문자열을 숫자로 바꾼다. 측정 실패('ERROR')면 None.
+    """
+    try:
+        return float(str(text).rstrip('%'))
+    except ValueError:
+        return None
+
+
+class MetricsExporter:
+    """
+    /metrics 경로로 시스템 정보, CPU/메모리 사용률, 센서값을 제공한다.
+    sensor_source는 python3/python4의 DummySensor처럼 sensors 목록을 가진 객체다.
+    센서값은 갱신하지 않고 마지막으로 측정된 값만 읽으므로, 측정(set_env)은 센서를 가진 쪽에서 한다.
+    """
+
+    def __init__(self, computer, sensor_source=None, host='0.0.0.0', port=9100):
+        self.computer = computer
+        self.sensor_source = sensor_source
+        self.address = (host, port)
+        self.server = None
+        self._thread = None
+
+        # 시스템 정보 부분은 정보가 바뀔 때(설정 변경)만 다시 만듦
+        self._info = None
+        self.static_text = ''
+        self.payload = b''
+
+        # 측정할 때마다 응답 본문을 새로 만들도록 등록하고, 현재 값으로 한 번 만듦
+        computer.sampler.listeners.append(self.update)
+        self.update(computer.sampler.snapshot[0])
+
+    @staticmethod
+    def _render_static(info):
+        labels = ','.join(
+            f'{key}="{escape_label(info[key])}"' for key in ('os', 'os_version', 'cpu_type') if key in info
+        )
+        lines = [
+            '# HELP mission_computer_info 미션 컴퓨터 시스템 정보',
+            '# TYPE mission_computer_info gauge',
+            f'mission_computer_info{{{labels}}} 1',
+        ]
+        if isinstance(info.get('cpu_cores'), int):
+            lines += [
+                '# HELP mission_computer_cpu_cores CPU 코어 개수',
+                '# TYPE mission_computer_cpu_cores gauge',
+                f'mission_computer_cpu_cores {info["cpu_cores"]}',
+            ]
+        if isinstance(info.get('memory_total'), int):
+            lines += [
+                '# HELP mission_computer_memory_total_bytes 메모리 총량',
+                '# TYPE mission_computer_memory_total_bytes gauge',
+                f'mission_computer_memory_total_bytes {info["memory_total"]}',
+            ]
+        return '\n'.join(lines) + '\n'
+
+    def update(self, load):
+        """
+        MetricsSampler가 새로 측정할 때마다 (측정 스레드에서) 호출되어 응답 본문을 다시 만든다.
+        """
+        info = self.computer.info
+        if info is not self._info:
+            self._info = info
+            self.static_text = self._render_static(info)
+
+        lines = []
+
+        cpu_usage = percent_value(load.get('cpu_usage', 'ERROR'))
+        if cpu_usage is not None:
+            lines += [
+                '# HELP mission_computer_cpu_usage_percent 전체 CPU 사용률',
+                '# TYPE mission_computer_cpu_usage_percent gauge',
+                f'mission_computer_cpu_usage_percent {cpu_usage}',
+            ]
+
+        cores = load.get('cpu_usage_per_core')
+        if cores:
+            lines += [
+                '# HELP mission_computer_cpu_core_usage_percent 코어별 CPU 사용률',
+                '# TYPE mission_computer_cpu_core_usage_percent gauge',
+            ]
+            lines += [
+                f'mission_computer_cpu_core_usage_percent{{core="{name}"}} {percent_value(value)}'
+                for name, value in cores.items() if percent_value(value) is not None
+            ]
+
+        process_usage = percent_value(load.get('process_cpu_usage', 'ERROR'))
+        if process_usage is not None:
+            lines += [
+                '# HELP mission_computer_process_cpu_usage_percent 이 프로세스의 CPU 사용률',
+                '# TYPE mission_computer_process_cpu_usage_percent gauge',
+                f'mission_computer_process_cpu_usage_percent {process_usage}',
+            ]
+
+        memory_usage = percent_value(load.get('memory_usage', 'ERROR'))
+        if memory_usage is not None:
+            lines += [
+                '# HELP mission_computer_memory_usage_percent 메모리 사용률',
+                '# TYPE mission_computer_memory_usage_percent gauge',
+                f'mission_computer_memory_usage_percent {memory_usage}',
+            ]
+
+        if self.sensor_source is not None:
+            lines += [
+                '# HELP mars_base_sensor_value 화성 기지 센서 측정값',
+                '# TYPE mars_base_sensor_value gauge',
+            ]
+            lines += [
+                f'mars_base_sensor_value{{sensor="{escape_label(sensor.name)}",'
+                f'unit="{escape_label(sensor.unit)}"}} {sensor.value}'
+                for sensor in self.sensor_source.sensors if sensor.value is not None
+            ]
+
+        # 참조를 통째로 바꾸므로 응답 중인 스레드는 이전 본문을 끝까지 보낸다
+        self.payload = (self.static_text + '\n'.join(lines) + '\n').encode('utf-8')
+
+    def _handler_class(self):
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                payload = exporter.payload
+                self.send_response(200)
+                self.send_header('Content-Type', CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass  # 요청마다 표준 오류로 기록하지 않음
+
+        return Handler
+
+    def start(self):
+        """
+        백그라운드 스레드에서 HTTP 서버를 시작한다.
+        """
+        if self.server is None:
+            self.server = ThreadingHTTPServer(self.address, self._handler_class())
+            self.server.daemon_threads = True
+            self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self._thread.join()
+            self.server = None
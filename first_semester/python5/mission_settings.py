@@ -0,0 +1,94 @@
+# setting.txt(항목별 출력 여부)를 읽어 바꿀 수 없는 Settings 객체로 만드는 모듈
+# 파일은 수정 시각(mtime)이 바뀌었을 때만 다시 읽으므로 매 측정마다 확인해도 비용이 작다.
+import os
+from dataclasses import dataclass, field, fields
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    항목별 출력 여부. 파일에 없는 항목은 기본값(True)을 사용한다.
+    enabled에는 켜진 항목 이름이 선언 순서대로 미리 계산되어 들어 있다.
+    """
+
+    os: bool = True
+    os_version: bool = True
+    cpu_type: bool = True
+    cpu_cores: bool = True
+    memory_total: bool = True
+    cpu_usage: bool = True
+    memory_usage: bool = True
+    enabled: tuple = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        names = tuple(f.name for f in fields(self) if f.init and getattr(self, f.name))
+        object.__setattr__(self, 'enabled', names)
+
+
+SETTING_KEYS = tuple(f.name for f in fields(Settings) if f.init)
+
+
+def parse_settings(text):
+    """
+    'key=True/False' 형식의 줄을 읽어 Settings를 만든다.
+    알 수 없는 항목이나 True/False가 아닌 값은 경고를 출력하고 무시한다.
+    """
+    values = {}
+    for number, line in enumerate(text.splitlines(), 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        key, sep, value = line.partition('=')
+        key = key.strip()
+        value = value.strip().lower()
+        if not sep or key not in SETTING_KEYS or value not in ('true', 'false'):
+            print(f'설정 파일 {number}번째 줄을 무시합니다: {line}')
+            continue
+        values[key] = (value == 'true')
+    return Settings(**values)
+
+
+class SettingsFile:
+    """
+    설정 파일과 마지막으로 읽은 Settings를 함께 보관한다.
+    reload_if_changed()는 os.stat 한 번으로 변경 여부를 확인하고, 바뀐 경우에만 다시 읽는다.
+    """
+
+    def __init__(self, path='setting.txt'):
+        self.path = path
+        self.mtime = None  # 마지막으로 읽은 파일의 (수정 시각, 크기), 파일이 없으면 None
+        self.settings = Settings()
+        self.reload_if_changed()
+
+    def reload_if_changed(self):
+        """
+        파일이 바뀌었으면 다시 읽고 True를 반환한다.
+        파일이 없어지면 기본값으로 돌아가고, 읽다가 오류가 나면 이전 설정을 유지한다.
+        """
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            if self.mtime is None:
+                return False
+            self.mtime = None
+            self.settings = Settings()
+            return True
+        except OSError as e:
+            print(f'설정 파일을 확인할 수 없습니다: {e}')
+            return False
+
+        mtime = (stat.st_mtime_ns, stat.st_size)
+        if mtime == self.mtime:
+            return False
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                settings = parse_settings(f.read())
+        except (OSError, UnicodeDecodeError) as e:
+            print(f'설정 파일을 읽을 수 없습니다: {e}')
+            return False
+
+        self.mtime = mtime
+        changed = settings != self.settings
+        self.settings = settings
+        return changed
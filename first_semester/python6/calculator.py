@@ -4,6 +4,8 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import Qt
 
+from calculator_logic import press
+
 
 class Calculator(QWidget):
     def __init__(self):
@@ -85,41 +87,7 @@ class Calculator(QWidget):
 
     def _on_click(self, text):
         """버튼 클릭 이벤트 처리 함수"""
-        current = self.display.text()
-
-        if text == 'AC':
-            self.display.setText('0')  # 전체 초기화
-        elif text == 'C':
-            self.display.setText(current[:-1] if len(current) > 1 else '0')  # 한 자리 지움
-        elif text == '=':
-            try:
-                # 연산자 문자 변환 후 계산
-                expression = current.replace('×', '*').replace('÷', '/')
-                result = eval(expression)
-                self.display.setText(str(result))
-            except:
-                self.display.setText('Error')  # 계산 실패 시
-        elif text == '±':
-            # 부호 반전
-            try:
-                if current.startswith('-'):
-                    self.display.setText(current[1:])
-                else:
-                    self.display.setText('-' + current)
-            except:
-                self.display.setText('Error')
-        elif text == '%':
-            # 백분율 처리
-            try:
-                self.display.setText(str(float(current) / 100))
-            except:
-                self.display.setText('Error')
-        else:
-            # 일반 숫자나 연산자 입력
-            if current == '0' and text not in ['+', '-', '×', '÷', '.']:
-                self.display.setText(text)  # 처음 입력이면 덮어쓰기
-            else:
-                self.display.setText(current + text)  # 이어 붙이기
+        self.display.setText(press(self.display.text(), text))
 
 
 # 앱 실행부
@@ -0,0 +1,38 @@
+# 계산기 버튼 처리 로직
+# 화면(QLabel) 없이도 사용할 수 있도록 현재 표시 문자열과 누른 버튼만으로 다음 표시 문자열을 계산한다.
+
+
+def press(current, text):
+    """현재 표시 문자열(current)에서 버튼(text)을 눌렀을 때 새 표시 문자열 반환"""
+    if text == 'AC':
+        return '0'  # 전체 초기화
+    elif text == 'C':
+        return current[:-1] if len(current) > 1 else '0'  # 한 자리 지움
+    elif text == '=':
+        try:
+            # 연산자 문자 변환 후 계산
+            expression = current.replace('×', '*').replace('÷', '/')
+            return str(eval(expression))
+        except:
+            return 'Error'  # 계산 실패 시
+    elif text == '±':
+        # 부호 반전
+        try:
+            if current.startswith('-'):
+                return current[1:]
+            else:
+                return '-' + current
+        except:
+            return 'Error'
+    elif text == '%':
+        # 백분율 처리
+        try:
+            return str(float(current) / 100)
+        except:
+            return 'Error'
+    else:
+        # 일반 숫자나 연산자 입력
+        if current == '0' and text not in ['+', '-', '×', '÷', '.']:
+            return text  # 처음 입력이면 덮어쓰기
+        else:
+            return current + text  # 이어 붙이기
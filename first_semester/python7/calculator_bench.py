@@ -0,0 +1,80 @@
+import random
+import sys
+import time
+
+from calculator_core import Calculator
+
+# 키 입력 재생 벤치마크
+# 기록된(또는 무작위로 만든) 긴 버튼 입력 순서를 화면 없이 Calculator에 재생해서
+# 숫자 형식(float / Decimal / Fraction)별 초당 키 입력 처리 수를 비교한다.
+#
+# 실행: python calculator_bench.py [키 개수] [기록 파일]
+#   기록 파일이 있으면 그 파일(공백으로 구분한 버튼 글자)을 재생하고, 없으면 무작위 입력을 만들어 파일로 저장한다.
+
+OPERATOR_KEYS = ['+', '−', '×', '÷']
+
+
+# 사람이 누르는 것과 비슷한 무작위 입력 만들기
+# 1~8자리 숫자(가끔 소수점), 연산자, 가끔 % / +/-, 2~6개 피연산자마다 =, 가끔 AC
+def generate_keys(count, seed=0):
+    rng = random.Random(seed)
+    keys = []
+    while len(keys) < count:
+        for i in range(rng.randint(2, 6)):
+            if i and rng.random() < 0.1:
+                keys.append('+/-')
+            digits = [str(rng.randint(0, 9)) for _ in range(rng.randint(1, 8))]
+            if rng.random() < 0.3:
+                digits.insert(rng.randint(1, len(digits)), '.')
+            keys.extend(digits)
+            if rng.random() < 0.05:
+                keys.append('%')
+            keys.append(rng.choice(OPERATOR_KEYS))
+        keys[-1] = '='
+        if rng.random() < 0.2:
+            keys.append('AC')
+    return keys[:count]
+
+
+def load_keys(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read().split()
+
+
+def save_keys(path, keys):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(' '.join(keys))
+
+
+# 입력 전체를 재생하고 (경과 시간, 마지막 화면) 반환
+def replay(keys, number):
+    calculator = Calculator(number)
+    press = calculator.press
+    start = time.perf_counter()
+    for key in keys:
+        press(key)
+    return time.perf_counter() - start, calculator.get_display()
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    path = sys.argv[2] if len(sys.argv) > 2 else None
+
+    try:
+        keys = load_keys(path) if path else generate_keys(count)
+    except FileNotFoundError:
+        keys = generate_keys(count)
+        save_keys(path, keys)
+        print(f'기록 파일이 없어 무작위 입력을 만들어 저장했습니다: {path}')
+
+    print(f'키 입력 {len(keys):,}개 재생')
+    for mode in ('float', 'decimal', 'fraction'):
+        elapsed, display = replay(keys, mode)
+        print(f'  {mode:<8}: {elapsed:.3f}초 ({len(keys) / elapsed:,.0f}키/초), 마지막 화면: {display}')
+
+    # 반올림 오차 비교
+    for mode in ('float', 'decimal', 'fraction'):
+        calculator = Calculator(mode)
+        for key in ['0', '.', '1', '+', '0', '.', '2', '−', '0', '.', '3', '=']:
+            calculator.press(key)
+        print(f'  {mode:<8}: 0.1 + 0.2 − 0.3 = {calculator.get_display()}')
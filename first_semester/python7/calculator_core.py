@@ -0,0 +1,325 @@
+from decimal import Context, Decimal, localcontext
+from fractions import Fraction
+from functools import lru_cache
+
+from expression_engine import evaluate_tokens
+
+# 계산기 동작(상태 기계) 모듈
+# PyQt 없이 사용할 수 있도록 화면(CalculatorUI)과 분리되어 있다.
+#
+# 숫자 형식(number)은 float(기본), Decimal, Fraction 중에서 고를 수 있다.
+# 입력 중인 숫자는 키를 누를 때마다 (정수 부분, 소수 자릿수)로 바로 갱신해서 숫자로 보관하고,
+# 완성된 피연산자와 연산자는 토큰 목록(terms)에 숫자 그대로 쌓아 두므로 = 를 누를 때 문자열을 다시 읽지 않는다.
+# 화면 문자열도 조각 목록(pieces)과 입력 중인 숫자로 나누어 보관하고, 합친 문자열은 바뀐 뒤 처음 요청될 때만 만든다.
+# 그래서 키 하나를 처리하는 비용이 수식 길이와 상관없이 일정하다.
+# Decimal/Fraction을 사용하면 0.1 + 0.2 = 0.3 처럼 소수 계산에서 반올림 오차가 생기지 않는다.
+# Decimal은 기본 정밀도(28자리)가 아니라 피연산자 자릿수에 맞춘 정밀도로 계산하므로 긴 숫자도 반올림되지 않는다.
+# (나눗셈처럼 끝나지 않는 결과만 그 정밀도에서 반올림된다.)
+
+NUMBER_TYPES = {'float': float, 'decimal': Decimal, 'fraction': Fraction}
+
+# (정수로 본 전체 자릿수, 소수점 아래 자릿수) → 숫자
+NUMBER_BUILDERS = {
+    float: lambda digits, scale: digits / 10 ** scale if scale else float(digits),
+    Decimal: lambda digits, scale: Decimal(f'{digits}E-{scale}'),
+    Fraction: lambda digits, scale: Fraction(digits, 10 ** scale),
+}
+
+OPERATORS = ['+', '−', '×', '÷']
+
+# Decimal/Fraction 결과를 화면에 보여줄 때의 유효 자릿수
+EXACT_DISPLAY_DIGITS = 12
+DISPLAY_CONTEXT = Context(prec=EXACT_DISPLAY_DIGITS)
+
+# Decimal 계산 정밀도에 더하는 여유 자릿수 (나눗셈 결과의 유효 자릿수)
+DECIMAL_EXTRA_DIGITS = 28
+
+
+# 토큰 목록을 반올림 없이 계산할 수 있는 Decimal 정밀도
+# 곱셈 결과의 자릿수와 덧셈에서 자리를 맞춘 뒤의 자릿수는 피연산자 자릿수의 합을 넘지 않는다.
+def decimal_context(tokens):
+    digits = sum(len(value.as_tuple().digits) for kind, value in tokens if kind == 'value')
+    return Context(prec=digits + DECIMAL_EXTRA_DIGITS)
+
+
+# 결과 포맷 처리 (같은 값은 다시 포맷하지 않도록 캐시)
+# float는 기존과 같이 정수면 정수로, 아니면 유효숫자 6자리로 표시한다.
+@lru_cache(maxsize=1024, typed=True)
+def format_result(result):
+    if isinstance(result, float):
+        return str(int(result)) if result.is_integer() else f"{result:.6g}"
+    if isinstance(result, Fraction):
+        if result.denominator == 1:
+            return str(result.numerator)
+        result = Decimal(result.numerator) / Decimal(result.denominator)
+    if result == result.to_integral_value():
+        return str(int(result))
+    result = DISPLAY_CONTEXT.plus(result)
+    if result == result.to_integral_value():
+        return str(int(result))
+    return format(result.normalize(), 'g')
+
+
+# 계산기 동작 처리 클래스
+class Calculator:
+    def __init__(self, number=float):
+        self.number = NUMBER_TYPES.get(number, number)
+        self.build_number = NUMBER_BUILDERS[self.number]
+        # 버튼 글자 → 처리 함수
+        self.key_actions = {
+            'AC': self.reset, '+/-': self.negative_positive, '%': self.percent,
+            '÷': self.divide, '×': self.multiply, '−': self.subtract, '+': self.add,
+            '.': self.input_dot, '=': self.equal,
+        }
+        for digit in '0123456789':
+            self.key_actions[digit] = lambda digit=digit: self.input_digit(digit)
+        self.reset()
+
+    # 버튼 글자로 키 입력 처리 (화면 없이 입력을 재생할 때 사용)
+    def press(self, key):
+        self.key_actions[key]()
+
+    # 초기 상태로 리셋
+    def reset(self):
+        self.current = ''
+        self.operand = None
+        self.operator = None
+        self.result = None
+        self.new_input = True
+        self.after_equal = False
+        self.terms = []              # 완성된 피연산자/연산자 토큰 (('value', 숫자), ('op', '+') ...)
+        self.current_value = None    # 입력 중인 숫자 (current를 숫자로 변환한 값)
+        self.digits = 0              # 입력 중인 숫자의 자릿수들을 정수로 본 값 (12.5 → 125)
+        self.scale = None            # 소수점 아래 자릿수 (소수점을 누르지 않았으면 None)
+        self.negative = False
+        self.percent_count = 0       # 입력 중인 숫자 뒤에 붙은 % 개수
+
+        # 화면 표시: 완성된 조각(피연산자, ' + ' 같은 연산자) 목록 + 화면에 보이는 입력 중인 숫자
+        self.pieces = []
+        self.live = False            # 입력 중인 숫자(current)가 화면 끝에 표시되는지 여부
+        self._prefix = ''            # ''.join(self.pieces) 캐시 (None이면 다시 만들어야 함)
+        self._rendered = ''          # 전체 화면 문자열 캐시 (None이면 다시 만들어야 함)
+
+    # 각 연산자 버튼 처리 함수
+    def add(self): self._calculate('+', '+')
+    def subtract(self): self._calculate('-', '−')
+    def multiply(self): self._calculate('*', '×')
+    def divide(self): self._calculate('/', '÷')
+
+    # 화면 조각 추가 (캐시된 앞부분 문자열에 이어 붙임)
+    def _push_piece(self, piece):
+        self.pieces.append(piece)
+        if self._prefix is not None:
+            self._prefix += piece
+        self._rendered = None
+
+    # 화면에 보이는 입력 중인 숫자를 완성된 조각으로 옮김
+    def _push_live(self):
+        if self.live:
+            self._push_piece(self.current + '%' * self.percent_count)
+            self.live = False
+
+    # 화면을 current 하나만 보이는 상태로 (결과, Error)
+    def _show_only_current(self):
+        self.pieces = []
+        self._prefix = ''
+        self.live = True
+        self._rendered = None
+
+    # 화면이 비어 있는지 확인 (문자열을 만들지 않고)
+    def _display_empty(self):
+        return not self.pieces and not (self.live and (self.current or self.percent_count))
+
+    def get_display(self):
+        if self._rendered is None:
+            if self._prefix is None:
+                self._prefix = ''.join(self.pieces)
+            if self.live:
+                self._rendered = self._prefix + self.current + '%' * self.percent_count
+            else:
+                self._rendered = self._prefix
+        return self._rendered
+
+    # 이전 코드와의 호환을 위한 화면 문자열 속성
+    @property
+    def display_value(self):
+        return self.get_display()
+
+    # 자릿수 정보로 입력 중인 숫자 갱신 (문자열을 다시 읽지 않음)
+    # float로 나타낼 수 없을 만큼 긴 숫자면 오류 상태로 전환
+    def _update_current_value(self):
+        try:
+            value = self.build_number(self.digits, self.scale or 0)
+        except OverflowError:
+            self._error()
+            return
+        self.current_value = -value if self.negative else value
+
+    # 새 숫자 입력 시작 ('-'만 입력된 상태였으면 음수로 시작)
+    def _start_number(self):
+        self.negative = self.current == '-'
+        self.digits = 0
+        self.scale = None
+        self.percent_count = 0
+        self.new_input = False
+
+    # 퍼센트 계산 처리
+    # 값은 = 를 누를 때 계산식 엔진이 계산한다 (덧셈/뺄셈 뒤에서는 앞의 값 기준 백분율, 그 밖에는 /100)
+    def percent(self):
+        if not self.live or self.current_value is None:
+            return
+        self.percent_count += 1
+        self._rendered = None
+        self.new_input = True
+
+    # ± 버튼 눌렀을 때 부호 변경 처리
+    def negative_positive(self):
+        if self.after_equal:
+            self.reset()
+
+        if not self.current:
+            self.current = '-'
+            self.live = True
+            self._rendered = None
+            return
+
+        if self.current == '-':
+            self.current = ''
+            self.live = False
+            self._rendered = None
+            return
+
+        # % 가 붙은 숫자나 오류 상태는 부호를 바꾸지 않음
+        if self.percent_count or self.current_value is None:
+            return
+
+        # 현재 숫자 앞에 - 붙이거나 제거 (화면에 보이는 숫자면 화면도 함께 바뀜)
+        if self.current.startswith('-'):
+            self.current = self.current[1:]
+        else:
+            self.current = '-' + self.current
+        self.negative = not self.negative
+        self.current_value = -self.current_value
+        if self.live:
+            self._rendered = None
+
+    # 숫자 입력 처리
+    def input_digit(self, digit):
+        if self.after_equal:
+            self.reset()
+
+        if self.new_input:
+            if self.current == '-':
+                self._start_number()
+                self.current += digit
+            else:
+                self._push_live()
+                self._start_number()
+                self.current = digit
+                self.live = True
+        else:
+            self.current += digit
+        self._rendered = None
+
+        self.digits = self.digits * 10 + int(digit)
+        if self.scale is not None:
+            self.scale += 1
+        self._update_current_value()
+
+    # 소수점 입력 처리
+    def input_dot(self):
+        if self.after_equal:
+            self.reset()
+
+        if self.new_input:
+            if self.current != '-':
+                self._push_live()
+            self._start_number()
+            self.current = '-0.' if self.negative else '0.'
+            self.live = True
+            self.scale = 0
+            self._update_current_value()
+        elif self.scale is None:
+            self.current += '.'
+            self.scale = 0
+        self._rendered = None
+
+    # 입력 중인 숫자(와 뒤에 붙은 %)를 토큰으로 변환
+    def _current_tokens(self):
+        return [('value', self.current_value)] + [('op', '%')] * self.percent_count
+
+    # 오류 상태로 전환 (다음 입력은 = 뒤처럼 새 계산으로 시작)
+    def _error(self):
+        self.current = 'Error'
+        self.current_value = None
+        self.percent_count = 0
+        self.terms = []
+        self.operator = None
+        self.operand = None
+        self.new_input = True
+        self.after_equal = True
+        self._show_only_current()
+
+    # 연산자 버튼 처리
+    def _calculate(self, op_internal, op_display):
+        if self.after_equal:
+            self.after_equal = False
+
+        # 수식 처음에 음수 입력 허용
+        if op_internal == '-' and self._display_empty():
+            self.current = '-'
+            self.live = True
+            self._rendered = None
+            return
+
+        # 연산자 중복 입력 시 교체 (화면 끝이 연산자일 때)
+        if not self.live and self.pieces and self.pieces[-1].strip() in OPERATORS:
+            self.pieces[-1] = f' {op_display} '
+            self._prefix = None
+            self._rendered = None
+            self.operator = op_internal
+            self.terms[-1] = ('op', op_internal)
+            return
+
+        if not self.current or self.current == '-':
+            return
+
+        if self.current_value is None:
+            self._error()
+            return
+
+        self.operand = self.current_value
+        self.operator = op_internal
+        self.terms += self._current_tokens()
+        self.terms.append(('op', op_internal))
+        self._push_live()
+        self._push_piece(f' {op_display} ')
+        self.new_input = True
+
+    # = 버튼 처리
+    # 쌓아 둔 토큰 전체를 계산식 엔진으로 계산하므로 2 + 3 × 4 는 곱셈을 먼저 계산한다.
+    def equal(self):
+        if self.operator is None or self.operand is None or self.current in ['', '-']:
+            return
+        tokens = self.terms + self._current_tokens()
+        try:
+            if self.number is Decimal:
+                with localcontext(decimal_context(tokens)):
+                    self.result = evaluate_tokens(tokens, self.number)
+            else:
+                self.result = evaluate_tokens(tokens, self.number)
+            if abs(self.result) > 1e100:
+                raise OverflowError("Result too large")
+        except (ArithmeticError, ValueError, RecursionError):  # 0으로 나누기, 너무 큰 값, 계산식 오류
+            self._error()
+        else:
+            self.current = format_result(self.result)
+            # 다음 계산에는 화면에 표시된 반올림 값이 아닌 정확한 결과를 사용
+            self.current_value = self.result
+            self.percent_count = 0
+            self.terms = []
+            self._show_only_current()
+        self.operator = None
+        self.operand = None
+        self.new_input = True
+        self.after_equal = True
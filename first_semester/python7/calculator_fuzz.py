@@ -0,0 +1,269 @@
+import argparse
+import cProfile
+import importlib.util
+import math
+import os
+import pstats
+import random
+import time
+from fractions import Fraction
+
+from calculator_core import Calculator, format_result
+
+# 계산기 상태 기계 재생/퍼징 도구
+# 화면 없이 버튼 입력 순서를 대량으로 만들어 python7 Calculator(또는 python6 버튼 처리 로직)에 재생하고,
+# = 를 누른 뒤의 화면을 별도의 기준 계산기(reference)로 계산한 값과 비교한다.
+#
+# 실행 예)
+#   python calculator_fuzz.py                          # python7, float, 20만 개 입력 순서 검사
+#   python calculator_fuzz.py --mode fraction          # 분수 모드 (결과 문자열까지 정확히 비교)
+#   python calculator_fuzz.py --target python6         # python6 버튼 처리 로직 검사
+#   python calculator_fuzz.py --chaos                  # 완전히 무작위 키 입력으로 예외 발생 여부만 검사
+#   python calculator_fuzz.py --profile                # 재생 중 Calculator 메서드 프로파일 출력
+
+PYTHON7_KEYS = {'sub': '−', 'neg': '+/-'}
+PYTHON6_KEYS = {'sub': '-', 'neg': '±'}
+ALL_PYTHON7_KEYS = list('0123456789.') + ['+', '−', '×', '÷', '%', '+/-', '=', 'AC']
+LIMIT = 1e100  # python7 Calculator는 절댓값이 이보다 크면 Error
+
+
+# 피연산자 하나의 입력 순서와 (값, % 개수) 만들기
+def generate_operand(rng, names, allow_sign):
+    keys = []
+    int_digits = ''.join(str(rng.randint(0, 9)) for _ in range(rng.randint(1, 6)))
+    frac_digits = ''
+    if rng.random() < 0.3:
+        frac_digits = ''.join(str(rng.randint(0, 9)) for _ in range(rng.randint(0, 3)))
+        if rng.random() < 0.2:
+            int_digits = ''  # .5 처럼 소수점부터 입력
+        keys.extend(int_digits)
+        keys.append('.')
+        keys.extend(frac_digits)
+    else:
+        keys.extend(int_digits)
+    value = Fraction(int(int_digits or '0') * 10 ** len(frac_digits) + int(frac_digits or '0'), 10 ** len(frac_digits))
+
+    percents = 0
+    if allow_sign:
+        flips = rng.choice((0, 0, 0, 1, 2))
+        keys.extend([names['neg']] * flips)
+        if flips % 2:
+            value = -value
+        roll = rng.random()
+        percents = 2 if roll < 0.02 else 1 if roll < 0.1 else 0
+        keys.extend(['%'] * percents)
+    return keys, (value, percents)
+
+
+# AC로 시작해서 = 로 끝나는 입력 순서 하나와 (피연산자 목록, 연산자 목록) 만들기
+def generate_sequence(rng, names, allow_sign):
+    keys = ['AC']
+    operands = []
+    operators = []
+    for i in range(rng.randint(2, 6)):
+        if i:
+            op = rng.choice(('+', 'sub', '×', '÷'))
+            operators.append('-' if op == 'sub' else op)
+            keys.append(names.get(op, op))
+        operand_keys, operand = generate_operand(rng, names, allow_sign)
+        keys.extend(operand_keys)
+        operands.append(operand)
+    keys.append('=')
+    return keys, operands, operators
+
+
+# 기준 계산기: 분수로 정확하게 계산 (곱셈/나눗셈 우선)
+# 덧셈/뺄셈 뒤에 % 가 붙은 숫자 하나만 오면 앞의 값 기준 백분율, 그 밖의 % 는 /100
+# 0으로 나누면 None
+def reference_value(operands, operators):
+    terms = [[(None, operands[0])]]
+    add_operators = []
+    for op, operand in zip(operators, operands[1:]):
+        if op in ('×', '÷'):
+            terms[-1].append((op, operand))
+        else:
+            add_operators.append(op)
+            terms.append([(None, operand)])
+
+    def factor(operand):
+        value, percents = operand
+        return value / 100 ** percents
+
+    def term_value(term):
+        result = factor(term[0][1])
+        for op, operand in term[1:]:
+            if op == '×':
+                result *= factor(operand)
+            else:
+                divisor = factor(operand)
+                if divisor == 0:
+                    raise ZeroDivisionError
+                result /= divisor
+        return result
+
+    try:
+        total = term_value(terms[0])
+        for op, term in zip(add_operators, terms[1:]):
+            if len(term) == 1 and term[0][1][1]:
+                change = total * factor(term[0][1])
+            else:
+                change = term_value(term)
+            total = total + change if op == '+' else total - change
+    except ZeroDivisionError:
+        return None
+    return total
+
+
+# 화면 값과 기준 값 비교
+def matches(display, expected, exact, rel_tol):
+    if expected is None:
+        return display == 'Error'
+    if exact:
+        return display == format_result(expected)
+    try:
+        value = float(display)
+    except ValueError:
+        return False
+    return math.isclose(value, float(expected), rel_tol=rel_tol, abs_tol=1e-9)
+
+
+# python6의 버튼 처리 로직 불러오기 (모듈 이름이 겹치지 않도록 경로로 불러옴)
+def load_python6_press():
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'python6', 'calculator_logic.py')
+    spec = importlib.util.spec_from_file_location('python6_calculator_logic', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.press
+
+
+# 입력 순서 묶음을 재생하고 (입력 순서별 마지막 화면 목록, 누른 키 개수, 경과 시간) 반환
+def replay_python7(calculator, sequences):
+    press = calculator.press
+    get_display = calculator.get_display
+    displays = []
+    keys = 0
+    start = time.perf_counter()
+    for sequence in sequences:
+        for key in sequence:
+            press(key)
+        displays.append(get_display())
+        keys += len(sequence)
+    return displays, keys, time.perf_counter() - start
+
+
+def replay_python6(press, sequences):
+    displays = []
+    keys = 0
+    display = '0'
+    start = time.perf_counter()
+    for sequence in sequences:
+        for key in sequence:
+            display = press(display, key)
+        displays.append(display)
+        keys += len(sequence)
+    return displays, keys, time.perf_counter() - start
+
+
+# 입력 순서를 batch개씩 만들어 재생하고 기준 값과 비교
+def run_checked(args):
+    rng = random.Random(args.seed)
+    if args.target == 'python7':
+        calculator = Calculator(args.mode)
+        names = PYTHON7_KEYS
+        replay = lambda sequences: replay_python7(calculator, sequences)
+        exact = args.mode == 'fraction'
+        rel_tol = 1e-5  # 화면에는 유효숫자 6자리(float)까지만 표시
+    else:
+        press = load_python6_press()
+        names = PYTHON6_KEYS
+        replay = lambda sequences: replay_python6(press, sequences)
+        exact = False
+        rel_tol = 1e-9
+
+    # python6의 ± 는 수식 전체의 부호를 바꾸고 % 는 수식이 숫자 하나일 때만 동작하므로 검사 대상에서 제외
+    allow_sign = args.target == 'python7'
+
+    total_keys = 0
+    total_time = 0.0
+    failures = []
+    done = 0
+    while done < args.sequences:
+        batch = [generate_sequence(rng, names, allow_sign) for _ in range(min(args.batch, args.sequences - done))]
+        displays, keys, elapsed = replay([keys for keys, _, _ in batch])
+        total_keys += keys
+        total_time += elapsed
+
+        for (sequence, operands, operators), display in zip(batch, displays):
+            expected = reference_value(operands, operators)
+            if expected is not None and args.target == 'python7' and abs(expected) > LIMIT:
+                expected = None
+            if not matches(display, expected, exact, rel_tol):
+                failures.append((sequence, display, expected))
+        done += len(batch)
+
+    print(f'[{args.target}{"/" + args.mode if args.target == "python7" else ""}] '
+          f'입력 순서 {done:,}개, 키 입력 {total_keys:,}개')
+    print(f'  재생 시간: {total_time:.2f}초 ({total_keys / total_time:,.0f}키/초)')
+    print(f'  불일치: {len(failures):,}개')
+    for sequence, display, expected in failures[:args.show]:
+        expected_text = 'Error' if expected is None else f'{float(expected):.10g}'
+        print(f'    {" ".join(sequence)}  → 화면 {display!r}, 기준 {expected_text}')
+    return failures
+
+
+# 완전히 무작위 키 입력을 재생하며 예외가 발생하는지만 검사 (python7)
+def run_chaos(args):
+    rng = random.Random(args.seed)
+    calculator = Calculator(args.mode)
+    history = []
+    errors = []
+    start = time.perf_counter()
+    for _ in range(args.sequences * 10):
+        key = rng.choice(ALL_PYTHON7_KEYS)
+        history.append(key)
+        try:
+            calculator.press(key)
+            if not isinstance(calculator.get_display(), str):
+                raise TypeError('화면 값이 문자열이 아닙니다.')
+        except Exception as e:
+            errors.append((history[-20:], repr(e)))
+            calculator.reset()
+        if key == 'AC':
+            history = []
+    elapsed = time.perf_counter() - start
+
+    count = args.sequences * 10
+    print(f'[python7/{args.mode} 무작위 입력] 키 입력 {count:,}개: {elapsed:.2f}초 ({count / elapsed:,.0f}키/초)')
+    print(f'  예외: {len(errors):,}개')
+    for keys, error in errors[:args.show]:
+        print(f'    ... {" ".join(keys)}  → {error}')
+    return errors
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='계산기 상태 기계 재생/퍼징 도구')
+    parser.add_argument('--target', choices=['python6', 'python7'], default='python7', help='검사할 계산기')
+    parser.add_argument('--mode', choices=['float', 'decimal', 'fraction'], default='float', help='python7 숫자 형식')
+    parser.add_argument('--sequences', type=int, default=200000, help='재생할 입력 순서 개수 (기본: 200000)')
+    parser.add_argument('--batch', type=int, default=10000, help='한 번에 만들어 재생할 입력 순서 개수')
+    parser.add_argument('--seed', type=int, default=0, help='무작위 시드')
+    parser.add_argument('--chaos', action='store_true', help='무작위 키 입력으로 예외 발생 여부만 검사')
+    parser.add_argument('--profile', action='store_true', help='Calculator 메서드별 실행 시간 출력')
+    parser.add_argument('--show', type=int, default=5, help='출력할 불일치/예외 예시 개수')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    run = run_chaos if args.chaos else run_checked
+
+    if args.profile:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        run(args)
+        profiler.disable()
+        print()
+        stats = pstats.Stats(profiler)
+        stats.sort_stats('tottime').print_stats('calculator_core|calculator_logic|expression_engine', 12)
+    else:
+        run(args)
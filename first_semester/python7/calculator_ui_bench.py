@@ -0,0 +1,63 @@
+import os
+import sys
+import time
+
+# 화면이 없는 환경에서도 실행되도록 offscreen 플랫폼 사용 (이미 지정되어 있으면 그대로 사용)
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtTest import QTest
+from PyQt5.QtWidgets import QApplication
+
+from calculator import CalculatorUI
+from calculator_bench import generate_keys
+
+# UI 클릭 벤치마크
+# QTest로 실제 버튼을 클릭해서 (신호 → button_clicked → 화면 갱신) 초당 클릭 처리 수를 측정한다.
+# 클릭할 때마다 스타일시트를 새로 만들어 적용하던 이전 방식(RestyleEveryClickUI)과 비교한다.
+#
+# 실행: python calculator_ui_bench.py [클릭 수]
+
+
+# 이전 방식: 클릭할 때마다 화면 문자열을 두 번 가져오고 스타일시트를 새로 적용
+class RestyleEveryClickUI(CalculatorUI):
+    def button_clicked(self, handler):
+        handler()
+        self.display.setText(self.calculator.get_display())
+        length = len(self.calculator.get_display().replace(",", ""))
+        font_size = 50 if length <= 6 else 40 if length <= 12 else 30
+        self.display.setStyleSheet(f"color: white; font-size: {font_size}px; background: black; padding: 20px;")
+
+
+# 키 입력 순서대로 버튼을 클릭하고 (경과 시간, 마지막 화면) 반환
+def click_through(app, ui_class, keys):
+    ui = ui_class()
+    ui.show()
+    app.processEvents()
+    buttons = [ui.buttons[key] for key in keys]
+
+    start = time.perf_counter()
+    for button in buttons:
+        QTest.mouseClick(button, Qt.LeftButton)
+    app.processEvents()  # 클릭 후 쌓인 다시 그리기 이벤트까지 처리
+    elapsed = time.perf_counter() - start
+
+    display = ui.display.text()
+    ui.close()
+    return elapsed, display
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    app = QApplication(sys.argv[:1])
+    keys = generate_keys(count)
+
+    print(f'버튼 클릭 {len(keys):,}회 ({os.environ["QT_QPA_PLATFORM"]} 플랫폼)')
+    results = {}
+    for name, ui_class in (('이전 방식 (매번 스타일 적용)', RestyleEveryClickUI), ('현재 방식', CalculatorUI)):
+        elapsed, display = click_through(app, ui_class, keys)
+        results[name] = display
+        print(f'  {name}: {elapsed:.2f}초 ({len(keys) / elapsed:,.0f}클릭/초)')
+
+    if len(set(results.values())) != 1:
+        print('  경고: 두 방식의 마지막 화면이 다릅니다.')
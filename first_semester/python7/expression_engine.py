@@ -0,0 +1,384 @@
+import operator
+import re
+import sys
+import time
+from functools import lru_cache
+
+# 계산식 엔진
+# 계산식 문자열을 토큰으로 나누고(tokenize), 연산자 우선순위에 따라 구문 트리(AST)를 만든 뒤,
+# 트리를 후위 표기(RPN) 명령 목록으로 컴파일해서 스택으로 계산한다.
+# 파싱, 컴파일, 계산 모두 재귀 호출 없이 반복문으로 처리하므로 피연산자가 수만 개인 계산식도 계산할 수 있다.
+# PyQt 없이 단독으로 사용할 수 있고, 한 번 컴파일한 계산식은 캐시에 보관해서 다시 파싱하지 않는다.
+#
+# 지원 문법: 숫자(1, 2.5, .5, 1e+20), 변수 이름, + - * / (× − ÷ 표기 포함), 단항 +/-, 괄호,
+#           뒤에 붙는 % (덧셈/뺄셈의 오른쪽이면 왼쪽 값의 백분율, 그 밖에는 /100)
+
+
+# 계산식 문법 오류 또는 정의되지 않은 변수
+class ExpressionError(ValueError):
+    pass
+
+
+TOKEN_PATTERN = re.compile(
+    r'\s*(?:(?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)'
+    r'|(?P<name>[A-Za-z_]\w*)'
+    r'|(?P<op>[-+*/%()×÷−]))'
+)
+
+# 화면 표기용 연산자를 내부 연산자로 변환
+OPERATOR_ALIASES = {'×': '*', '÷': '/', '−': '-'}
+
+# 이항 연산자 우선순위 (모두 왼쪽 결합)
+BINARY_PRECEDENCE = {'+': 1, '-': 1, '*': 2, '/': 2}
+
+
+# 계산식 문자열을 (종류, 값) 토큰 목록으로 변환
+def tokenize(text):
+    tokens = []
+    position = 0
+    end = len(text.rstrip())
+    while position < end:
+        match = TOKEN_PATTERN.match(text, position)
+        if match is None:
+            raise ExpressionError(f'알 수 없는 문자입니다: {text[position:].strip()[:1]!r}')
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == 'op':
+            value = OPERATOR_ALIASES.get(value, value)
+        tokens.append((kind, value))
+        position = match.end()
+    return tokens
+
+
+# 구문 트리 노드
+class Number:
+    __slots__ = ('text',)
+
+    def __init__(self, text):
+        self.text = text
+
+
+# 이미 숫자로 변환된 값 (('value', 숫자) 토큰에서 만들어짐)
+class Constant:
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+
+class Variable:
+    __slots__ = ('name',)
+
+    def __init__(self, name):
+        self.name = name
+
+
+class Unary:
+    __slots__ = ('op', 'operand')
+
+    def __init__(self, op, operand):
+        self.op = op
+        self.operand = operand
+
+
+class Percent:
+    __slots__ = ('operand',)
+
+    def __init__(self, operand):
+        self.operand = operand
+
+
+class Binary:
+    __slots__ = ('op', 'left', 'right')
+
+    def __init__(self, op, left, right):
+        self.op = op
+        self.left = left
+        self.right = right
+
+
+# 연산자 우선순위 파서 (스택 사용, 재귀 없음)
+# 연산자 스택에서 우선순위가 같거나 높은 연산자를 먼저 묶으므로
+# 2 + 3 × 4 는 2 + (3 × 4) 로, 8 − 3 − 2 는 (8 − 3) − 2 로 해석된다.
+# 단항 +/- 는 모든 이항 연산자보다 먼저 묶이고(-2 × 3 → (-2) × 3), 뒤에 붙는 % 는 바로 앞 값에 붙는다.
+class Parser:
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.output = []      # 완성된 구문 트리 노드 스택
+        self.operators = []   # ('unary', 연산자) / ('binary', 연산자, 우선순위) / ('(',)
+
+    # 연산자 스택 맨 위의 연산자 하나를 노드로 묶음
+    def reduce(self):
+        operator = self.operators.pop()
+        if operator[0] == 'unary':
+            self.output.append(Unary(operator[1], self.output.pop()))
+        else:
+            right = self.output.pop()
+            left = self.output.pop()
+            self.output.append(Binary(operator[1], left, right))
+
+    def parse(self):
+        if not self.tokens:
+            raise ExpressionError('계산식이 비어 있습니다.')
+
+        operators = self.operators
+        expect_operand = True
+        for kind, value in self.tokens:
+            if expect_operand:
+                if kind == 'number':
+                    self.output.append(Number(value))
+                elif kind == 'value':
+                    self.output.append(Constant(value))
+                elif kind == 'name':
+                    self.output.append(Variable(value))
+                elif value in ('+', '-'):
+                    operators.append(('unary', value))
+                    continue
+                elif value == '(':
+                    operators.append(('(',))
+                    continue
+                else:
+                    raise ExpressionError(f'예상하지 못한 토큰입니다: {value}')
+                expect_operand = False
+            elif value == '%':
+                self.output[-1] = Percent(self.output[-1])
+            elif kind == 'op' and value in BINARY_PRECEDENCE:
+                precedence = BINARY_PRECEDENCE[value]
+                while operators and (operators[-1][0] == 'unary'
+                                     or (operators[-1][0] == 'binary' and operators[-1][2] >= precedence)):
+                    self.reduce()
+                operators.append(('binary', value, precedence))
+                expect_operand = True
+            elif value == ')':
+                while operators and operators[-1][0] != '(':
+                    self.reduce()
+                if not operators:
+                    raise ExpressionError('예상하지 못한 토큰입니다: )')
+                operators.pop()
+            else:
+                raise ExpressionError(f'예상하지 못한 토큰입니다: {value}')
+
+        if expect_operand:
+            raise ExpressionError('계산식이 끝나지 않았습니다.')
+        while operators:
+            if operators[-1][0] == '(':
+                raise ExpressionError('닫는 괄호가 없습니다.')
+            self.reduce()
+        return self.output[0]
+
+
+# 계산식 문자열을 구문 트리로 변환
+def parse(text):
+    return Parser(tokenize(text)).parse()
+
+
+# 이항 연산 함수
+BINARY_OPERATIONS = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+}
+
+
+# RPN 명령 종류
+PUSH, LOAD, NEGATE, PERCENT, BINARY, BINARY_PERCENT = range(6)
+
+
+# 구문 트리를 RPN 명령 목록 [(명령, 인자), ...]으로 컴파일 (재귀 없이 후위 순회)
+# 변수가 없는 부분은 컴파일할 때 미리 계산해서 PUSH 하나로 바꾼다(상수 접기).
+def compile_tree(tree, number):
+    code = []
+    compiled = []  # 컴파일된 하위 트리마다 (상수 여부, 상수 값, code에서의 시작 위치)
+    hundred = number(100)
+
+    # 하위 트리 결과를 상수 하나로 교체
+    def fold(start, value):
+        del code[start:]
+        code.append((PUSH, value))
+        compiled.append((True, value, start))
+
+    pending = [(tree, False)]
+    while pending:
+        node, children_done = pending.pop()
+
+        if isinstance(node, (Number, Constant)):
+            value = number(node.text) if isinstance(node, Number) else node.value
+            compiled.append((True, value, len(code)))
+            code.append((PUSH, value))
+
+        elif isinstance(node, Variable):
+            compiled.append((False, None, len(code)))
+            code.append((LOAD, node.name))
+
+        elif not children_done:
+            pending.append((node, True))
+            if isinstance(node, Binary):
+                pending.append((node.right, False))
+                pending.append((node.left, False))
+            else:
+                pending.append((node.operand, False))
+
+        elif isinstance(node, Unary):
+            if node.op == '-':
+                constant, value, start = compiled.pop()
+                if constant:
+                    fold(start, -value)
+                else:
+                    code.append((NEGATE, None))
+                    compiled.append((False, None, start))
+
+        elif isinstance(node, Percent):
+            constant, value, start = compiled.pop()
+            if constant:
+                fold(start, value / hundred)
+            else:
+                code.append((PERCENT, hundred))
+                compiled.append((False, None, start))
+
+        else:
+            right_constant, right_value, _ = compiled.pop()
+            left_constant, left_value, start = compiled.pop()
+            operation = BINARY_OPERATIONS[node.op]
+            # 덧셈/뺄셈의 오른쪽 백분율은 왼쪽 값 기준 (예: 50 + 10% → 50 + 5)
+            of_left = node.op in ('+', '-') and isinstance(node.right, Percent)
+            if left_constant and right_constant:
+                fold(start, operation(left_value, left_value * right_value) if of_left
+                     else operation(left_value, right_value))
+            else:
+                code.append((BINARY_PERCENT if of_left else BINARY, operation))
+                compiled.append((False, None, start))
+
+    return code
+
+
+# RPN 명령 목록을 스택으로 계산
+def run_code(code, env):
+    stack = []
+    push = stack.append
+    pop = stack.pop
+    for instruction, argument in code:
+        if instruction == PUSH:
+            push(argument)
+        elif instruction == LOAD:
+            try:
+                push(env[argument])
+            except KeyError:
+                raise ExpressionError(f'정의되지 않은 변수입니다: {argument}') from None
+        elif instruction == BINARY:
+            right = pop()
+            stack[-1] = argument(stack[-1], right)
+        elif instruction == BINARY_PERCENT:
+            ratio = pop()
+            base = stack[-1]
+            stack[-1] = argument(base, base * ratio)
+        elif instruction == NEGATE:
+            stack[-1] = -stack[-1]
+        else:
+            stack[-1] = stack[-1] / argument
+    return stack[0]
+
+
+# 트리 깊이가 이보다 얕은 계산식은 클로저로 바꿔서 계산 (클로저 호출은 깊이만큼 재귀하지만 스택 반복보다 빠름)
+CLOSURE_DEPTH_LIMIT = 100
+
+
+# RPN 명령 목록을 클로저 하나로 변환 (명령을 차례로 읽으며 값 대신 함수를 스택에 쌓음, 재귀 없음)
+# 트리 깊이가 CLOSURE_DEPTH_LIMIT 이상이면 None
+def build_closure(code):
+    stack = []  # (함수, 깊이)
+    for instruction, argument in code:
+        if instruction == PUSH:
+            stack.append(((lambda value: lambda env: value)(argument), 1))
+        elif instruction == LOAD:
+            def load(env, name=argument):
+                try:
+                    return env[name]
+                except KeyError:
+                    raise ExpressionError(f'정의되지 않은 변수입니다: {name}') from None
+            stack.append((load, 1))
+        elif instruction in (BINARY, BINARY_PERCENT):
+            right, right_depth = stack.pop()
+            left, left_depth = stack.pop()
+            depth = max(left_depth, right_depth) + 1
+            if instruction == BINARY:
+                function = (lambda op, l, r: lambda env: op(l(env), r(env)))(argument, left, right)
+            else:
+                def function(env, op=argument, l=left, r=right):
+                    base = l(env)
+                    return op(base, base * r(env))
+            stack.append((function, depth))
+        else:
+            operand, depth = stack.pop()
+            if instruction == NEGATE:
+                function = (lambda f: lambda env: -f(env))(operand)
+            else:
+                function = (lambda f, hundred: lambda env: f(env) / hundred)(operand, argument)
+            stack.append((function, depth + 1))
+        if stack[-1][1] >= CLOSURE_DEPTH_LIMIT:
+            return None
+    return stack[0][0]
+
+
+# 컴파일된 계산식
+class CompiledExpression:
+    __slots__ = ('text', 'variables', 'code', 'function')
+
+    def __init__(self, text, number=float):
+        self.text = text
+        self.code = compile_tree(parse(text), number)
+        self.variables = tuple(sorted({argument for instruction, argument in self.code if instruction == LOAD}))
+        # 얕은 계산식은 클로저, 깊은 계산식(긴 연산자 사슬 등)은 스택 반복으로 계산
+        self.function = build_closure(self.code)
+        if self.function is None:
+            code = self.code
+            self.function = lambda env: run_code(code, env)
+
+    # 변수 값 딕셔너리 하나로 계산
+    def evaluate(self, env=None):
+        return self.function(env if env is not None else {})
+
+    # 여러 변수 값 딕셔너리로 각각 계산해서 결과 목록 반환
+    def evaluate_many(self, bindings):
+        function = self.function
+        return [function(env) for env in bindings]
+
+
+# 컴파일 결과 캐시: 같은 계산식(과 숫자 형식)은 한 번만 파싱/컴파일
+@lru_cache(maxsize=1024)
+def compile_expression(text, number=float):
+    return CompiledExpression(text, number)
+
+
+# 계산식 하나를 계산 (variables: 변수 이름 → 값)
+def evaluate(text, variables=None, number=float):
+    return compile_expression(text, number).evaluate(variables)
+
+
+# 계산식 하나를 여러 변수 값 묶음으로 계산
+def evaluate_many(text, bindings, number=float):
+    return compile_expression(text, number).evaluate_many(bindings)
+
+
+# 문자열 대신 토큰 목록으로 바로 계산 (계산기처럼 피연산자를 이미 숫자로 가지고 있을 때 사용)
+# 토큰은 ('value', 숫자) 또는 ('op', '+', '-', '*', '/', '%', '(', ')') 형식이며 캐시하지 않는다.
+def evaluate_tokens(tokens, number=float):
+    return run_code(compile_tree(Parser(tokens).parse(), number), {})
+
+
+# 실행 부분: python expression_engine.py [계산식] [변수 묶음 개수]
+# 예) python expression_engine.py "price × (1 + tax%) − discount" 1000000
+if __name__ == '__main__':
+    text = sys.argv[1] if len(sys.argv) > 1 else 'price × (1 + tax%) − discount'
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 1000000
+
+    expression = compile_expression(text)
+    bindings = [{name: float(i % 100 + 1) for name in expression.variables} for i in range(count)]
+
+    start = time.perf_counter()
+    results = expression.evaluate_many(bindings)
+    elapsed = time.perf_counter() - start
+
+    print(f'계산식: {text}  (변수: {", ".join(expression.variables) or "없음"})')
+    print(f'첫 결과: {results[0]}')
+    print(f'{count}개 계산: {elapsed:.3f}초 ({count / elapsed:,.0f}회/초)')
@@ -0,0 +1,73 @@
+import unittest
+from fractions import Fraction
+
+from calculator_core import Calculator
+from expression_engine import ExpressionError, evaluate, evaluate_many, evaluate_tokens
+
+# 계산식 엔진과 계산기 = 처리 테스트
+# 실행: python -m unittest test_expression_engine.py
+
+LONG = 10000  # 재귀로 처리하면 RecursionError가 나는 길이
+
+
+class ExpressionEngineTest(unittest.TestCase):
+    def test_precedence(self):
+        self.assertEqual(evaluate('2 + 3 × 4'), 14)
+        self.assertEqual(evaluate('8 − 3 − 2'), 3)
+        self.assertEqual(evaluate('-2 × 3 + (1 + 2) ÷ 3'), -5)
+
+    def test_percent(self):
+        self.assertEqual(evaluate('50 + 10%'), 55)
+        self.assertEqual(evaluate('50 × 10%'), 5)
+        self.assertEqual(evaluate('a − 10%', {'a': 50}), 45)
+
+    def test_errors(self):
+        for text in ['', '2 +', '(2', '2 2', '2)', 'x']:
+            with self.assertRaises(ExpressionError):
+                evaluate(text)
+
+    def test_long_chain_text(self):
+        self.assertEqual(evaluate(' + '.join(['1'] * LONG)), LONG)
+        self.assertEqual(evaluate(' × '.join(['1'] * LONG) + ' − 1'), 0)
+        self.assertEqual(evaluate('(' * LONG + '1' + ')' * LONG), 1)
+        self.assertEqual(evaluate('-' * LONG + '1'), 1)
+
+    def test_long_chain_variables(self):
+        text = ' + '.join(['x'] * LONG)
+        self.assertEqual(evaluate_many(text, [{'x': 1}, {'x': 2}]), [LONG, 2 * LONG])
+
+    def test_long_chain_tokens(self):
+        tokens = [('value', Fraction(1, 3))]
+        for _ in range(LONG - 1):
+            tokens += [('op', '+'), ('value', Fraction(1, 3))]
+        self.assertEqual(evaluate_tokens(tokens, Fraction), Fraction(LONG, 3))
+
+
+class CalculatorLongInputTest(unittest.TestCase):
+    def test_long_expression_equal(self):
+        calculator = Calculator()
+        for _ in range(LONG):
+            calculator.press('1')
+            calculator.press('+')
+        calculator.press('1')
+        calculator.press('=')
+        self.assertEqual(calculator.get_display(), str(LONG + 1))
+
+    def test_float_operand_too_long(self):
+        calculator = Calculator('float')
+        for _ in range(320):
+            calculator.press('9')
+            if calculator.get_display() == 'Error':
+                break
+        self.assertEqual(calculator.get_display(), 'Error')
+
+    def test_decimal_beyond_default_precision(self):
+        for mode in ('decimal', 'fraction'):
+            calculator = Calculator(mode)
+            for key in list('1234567890123456789012345678901') + ['−'] + list('1234567890123456789012345678900') + ['=']:
+                calculator.press(key)
+            self.assertEqual(calculator.get_display(), '1', mode)
+
+
+if __name__ == '__main__':
+    unittest.main()
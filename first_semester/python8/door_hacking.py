@@ -1,43 +1,155 @@
-import zipfile
+import itertools
+import multiprocessing
+import os
+import sys
 import time
+import zipfile
+
+CHARSET = 'abcdefghijklmnopqrstuvwxyz0123456789'
+PASSWORD_LENGTH = 6
+
+# 전체 36^6개 비밀번호를 앞 2글자(36^2 = 1296개)로 나눈 구간 단위로 프로세스들에 나누어 맡긴다.
+# 구간 하나는 36^4 = 1,679,616개이므로 먼저 끝난 프로세스가 다음 구간을 가져가 부하가 고르게 나뉜다.
+PREFIX_LENGTH = 2
+CHUNK_SIZE = len(CHARSET) ** (PASSWORD_LENGTH - PREFIX_LENGTH)
+CHUNK_COUNT = len(CHARSET) ** PREFIX_LENGTH
+
+# 이만큼 시도할 때마다 공유 카운터에 진행 상황을 더하고 다른 프로세스가 찾았는지 확인
+CHECK_INTERVAL = 10000
+REPORT_INTERVAL = 5000000
+
+# 작업 프로세스마다 하나씩 가지는 값 (_init_worker에서 설정)
+_zip_file = None
+_member = None
+_found = None
+_attempts = None
+
+
+# 순번(0 ~ 36^length - 1)을 비밀번호 문자열로 변환 (0 → 'aaaaaa', 1 → 'aaaaab', ...)
+def index_to_password(index, length=PASSWORD_LENGTH):
+    chars = []
+    for _ in range(length):
+        index, digit = divmod(index, len(CHARSET))
+        chars.append(CHARSET[digit])
+    return ''.join(reversed(chars))
+
+
+# 비밀번호 검사에 사용할 항목: 암호가 걸린(flag_bits의 0번 비트) 첫 번째 파일 (없으면 None)
+# 폴더나 암호가 없는 파일은 비밀번호와 상관없이 열리므로 검사에 사용할 수 없다.
+def find_encrypted_member(zf):
+    for info in zf.infolist():
+        if not info.is_dir() and info.flag_bits & 0x1:
+            return info
+    return None
+
+
+# 비밀번호로 검사용 파일을 끝까지 읽어 본다 (압축 해제와 CRC 검사까지 통과해야 성공)
+def try_password(zf, member, password):
+    try:
+        with zf.open(member, pwd=password) as f:
+            while f.read(65536):
+                pass
+        return True
+    except Exception:
+        return False
+
 
+# 작업 프로세스 시작 시 한 번 실행: 프로세스마다 zip 파일을 따로 열어 둠
+def _init_worker(zip_path, found, attempts):
+    global _zip_file, _member, _found, _attempts
+    _zip_file = zipfile.ZipFile(zip_path, 'r')
+    _member = find_encrypted_member(_zip_file)
+    _found = found
+    _attempts = attempts
 
-def unlock_zip():
-    charset = 'abcdefghijklmnopqrstuvwxyz0123456789'
-    attempt_count = 0
+
+# 공유 카운터에 시도 횟수 더하기
+def _add_attempts(count):
+    with _attempts.get_lock():
+        _attempts.value += count
+
+
+# 구간 하나(앞 2글자가 같은 비밀번호들) 검사: 찾으면 비밀번호, 못 찾거나 중단되면 None
+def search_chunk(chunk_index):
+    if _found.is_set():
+        return None
+
+    prefix = index_to_password(chunk_index, PREFIX_LENGTH).encode('utf-8')
+    charset = CHARSET.encode('utf-8')
+    zf = _zip_file
+    member = _member
+    pending = 0
+
+    for suffix in itertools.product(charset, repeat=PASSWORD_LENGTH - PREFIX_LENGTH):
+        password = prefix + bytes(suffix)
+        pending += 1
+        if try_password(zf, member, password):
+            _add_attempts(pending)
+            _found.set()
+            return password.decode('utf-8')
+        if pending == CHECK_INTERVAL:
+            _add_attempts(pending)
+            pending = 0
+            if _found.is_set():
+                return None
+
+    _add_attempts(pending)
+    return None
+
+
+def unlock_zip(zip_path='emergency_storage_key.zip', workers=None):
+    workers = workers or os.cpu_count() or 1
     start_time = time.time()
 
     print(f'암호 해제 시작... 시작 시간: {time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(start_time))}')
+    print(f'프로세스 {workers}개, 구간 {CHUNK_COUNT}개 (구간당 {CHUNK_SIZE:,}개)')
 
     try:
-        with zipfile.ZipFile('emergency_storage_key.zip', 'r') as zf:
-            for c1 in charset:
-                for c2 in charset:
-                    for c3 in charset:
-                        for c4 in charset:
-                            for c5 in charset:
-                                for c6 in charset:
-                                    password = c1 + c2 + c3 + c4 + c5 + c6
-                                    attempt_count += 1
-
-                                    if attempt_count % 5000000 == 0:
-                                        elapsed = time.time() - start_time
-                                        print(
-                                            f'[{attempt_count}회차] 시도 중... 경과 시간: {elapsed:.2f}초'
-                                        )
-
-                                    try:
-                                        zf.extractall(pwd=password.encode('utf-8'))
-                                        with open('password.txt', 'w') as f:
-                                            f.write(password)
-                                        elapsed = time.time() - start_time
-                                        print(f'성공! 비밀번호: {password}')
-                                        print(f'총 시도 횟수(=그동안의 반복 횟수): {attempt_count}')
-                                        print(f'총 소요 시간(=진행 시간)): {elapsed:.2f}초')
-                                        return
-                                    except Exception:
-                                        continue
-        print('실패: 비밀번호를 찾을 수 없습니다.')
+        # 작업을 나누기 전에 파일이 올바른 zip인지 먼저 확인
+        with zipfile.ZipFile(zip_path, 'r') as zf:
+            if not zf.infolist():
+                print('오류: zip 파일 안에 파일이 없습니다.')
+                return
+            if find_encrypted_member(zf) is None:
+                print('오류: zip 파일 안에 암호가 걸린 파일이 없습니다.')
+                return
+
+        found = multiprocessing.Event()
+        attempts = multiprocessing.Value('Q', 0)
+        password = None
+        next_report = REPORT_INTERVAL
+
+        with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(zip_path, found, attempts)) as pool:
+            results = pool.imap_unordered(search_chunk, range(CHUNK_COUNT))
+            while password is None:
+                try:
+                    password = results.next(timeout=1.0)
+                except multiprocessing.TimeoutError:
+                    pass
+                except StopIteration:
+                    break
+
+                attempt_count = attempts.value
+                if attempt_count >= next_report:
+                    elapsed = time.time() - start_time
+                    print(f'[{attempt_count}회차] 시도 중... 경과 시간: {elapsed:.2f}초')
+                    next_report = (attempt_count // REPORT_INTERVAL + 1) * REPORT_INTERVAL
+            # 찾았으면 나머지 프로세스는 기다리지 않고 종료 (with 블록을 나가면 terminate)
+
+        elapsed = time.time() - start_time
+        attempt_count = attempts.value
+        if password is None:
+            print('실패: 비밀번호를 찾을 수 없습니다.')
+            return
+
+        with zipfile.ZipFile(zip_path, 'r') as zf:
+            zf.extractall(pwd=password.encode('utf-8'))
+        with open('password.txt', 'w') as f:
+            f.write(password)
+        print(f'성공! 비밀번호: {password}')
+        print(f'총 시도 횟수(=그동안의 반복 횟수): {attempt_count}')
+        print(f'총 소요 시간(=진행 시간)): {elapsed:.2f}초')
+        print(f'초당 시도 횟수: {attempt_count / elapsed:,.0f}회')
     except FileNotFoundError:
         print('오류: zip 파일이 존재하지 않습니다.')
     except zipfile.BadZipFile:
@@ -46,5 +158,6 @@ def unlock_zip():
         print(f'예상치 못한 오류 발생: {e}')
 
 
+# 실행: python door_hacking.py [프로세스 수]  (기본: CPU 코어 수)
 if __name__ == '__main__':
-    unlock_zip()
+    unlock_zip(workers=int(sys.argv[1]) if len(sys.argv) > 1 else None)